@@ -13,6 +13,9 @@ import typing
 import itertools
 import math
 import bpy
+import numpy as np
+from . import attribute_cache
+from . import node_groups
 
 bl_info = {
     "name": "Attribute Viewer",
@@ -29,7 +32,8 @@ GEONODES_PATH = os.path.join("data", "attribute_viewer_nodes.blend")
 
 # Main data structure representing what name of nodegroup corresponds to what socket type.
 # If there are more than one viewer for one type, then the default spawned one should be
-# selectable from preferences.
+# selectable from preferences. Viewers present in 'node_groups.BUILDERS' are built from Python
+# instead of being loaded from the 'GEONODES_PATH' blend.
 VIEWER_NAMES = {
     "AV_Float-Value": (
         bpy.types.NodeSocketFloat,
@@ -39,12 +43,97 @@ VIEWER_NAMES = {
     "AV_Vector-Value": (bpy.types.NodeSocketVector, bpy.types.NodeSocketColor),
     "AV_Vector": (bpy.types.NodeSocketVector, bpy.types.NodeSocketColor),
     "AV_Color": (bpy.types.NodeSocketColor, bpy.types.NodeSocketVector),
+    node_groups.DIFF_VIEWER: (
+        bpy.types.NodeSocketFloat,
+        bpy.types.NodeSocketInt,
+        bpy.types.NodeSocketBool
+    ),
+    node_groups.HEATMAP_VIEWER: (
+        bpy.types.NodeSocketFloat,
+        bpy.types.NodeSocketInt,
+        bpy.types.NodeSocketBool
+    ),
+    node_groups.GRID_VIEWER: (
+        bpy.types.NodeSocketFloat,
+        bpy.types.NodeSocketInt,
+        bpy.types.NodeSocketBool
+    ),
 }
 
+# Viewers whose output replaces the viewed geometry instead of being joined to it
+GEOMETRY_REPLACING_VIEWERS = (node_groups.HEATMAP_VIEWER, )
+
 # How to scale text when it is spawned (so it looks somewhat good)
 GLOBAL_SCALE_FACTOR = 0.075
+# How to scale text relative to the average spacing of elements, so labels don't overlap
+SPACING_SCALE_FACTOR = 0.3
+# Maximum number of edges or points sampled when estimating the element spacing of huge meshes
+SPACING_SAMPLE_SIZE = 10000
+# Meshes up to this number of elements are bulk read when sampled, bigger ones element by element
+SPACING_BULK_READ_SIZE = 1000000
+# Custom property storing the last text size set automatically on the viewer node
+AUTO_SCALE_CUSTOM_PROP = "AV_AutoScale"
+# Custom properties of diff viewer storing how its reference is updated and from what object
+DIFF_REFERENCE_CUSTOM_PROP = "AV_DiffReference"
+DIFF_OBJECT_CUSTOM_PROP = "AV_DiffObject"
+# Attribute data type to the name of its value property and number of components
+ATTRIBUTE_VALUE_PROPS = {
+    'FLOAT': ("value", 1),
+    'INT': ("value", 1),
+    'INT8': ("value", 1),
+    'BOOLEAN': ("value", 1),
+    'FLOAT2': ("vector", 2),
+    'FLOAT_VECTOR': ("vector", 3),
+    'FLOAT_COLOR': ("color", 4),
+    'BYTE_COLOR': ("color", 4),
+}
+ATTRIBUTE_NUMPY_TYPES = {'INT': np.int32, 'INT8': np.int8, 'BOOLEAN': bool}
+# Socket type to data type of attribute it can be stored as
+SOCKET_ATTRIBUTE_TYPES = (
+    (bpy.types.NodeSocketFloat, 'FLOAT'),
+    (bpy.types.NodeSocketInt, 'INT'),
+    (bpy.types.NodeSocketBool, 'BOOLEAN'),
+    (bpy.types.NodeSocketVector, 'FLOAT_VECTOR'),
+    (bpy.types.NodeSocketColor, 'FLOAT_COLOR'),
+)
 # Custom property marked as True on node if the node is automatic viewer
 AUTO_VIEW_CUSTOM_PROP = "AV_Auto"
+# Custom property storing kind of helper node chained before 'Selection' input of a viewer
+VIEWER_HELPER_CUSTOM_PROP = "AV_Helper"
+FILTER_HELPER = "FILTER"
+INDEX_SELECTION_HELPER = "INDEX"
+# Kind of helper passing geometry to the viewer only on objects allowed by input of their
+# modifier, it is connected before the viewer 'Geometry' instead of its 'Selection'
+GATE_HELPER = "GATE"
+# Input added to the viewed node tree when its viewers are gated, it is set per modifier
+GATE_INPUT_NAME = "Show Attribute Viewers"
+# Kind of helper storing the viewed attribute before the group output, it isn't chained to viewer
+STORE_HELPER = "STORE"
+# Custom property referencing the object viewed by quick view object
+QUICK_VIEW_SOURCE_CUSTOM_PROP = "AV_QuickViewSource"
+QUICK_VIEW_OBJECT_PREFIX = "AV_QuickView_"
+# Object holding values of captured frame loaded from cache, shown through quick view
+CAPTURED_OBJECT_PREFIX = "AV_Captured_"
+CACHE_FILE_EXTENSION = ".avcache"
+# Attribute data type to the value of 'Type' input of quick view, see 'node_groups.QUICK_VIEW_TYPES'
+QUICK_VIEW_ATTRIBUTE_TYPES = {
+    'FLOAT': 0,
+    'INT': 0,
+    'INT8': 0,
+    'BOOLEAN': 0,
+    'FLOAT2': 1,
+    'FLOAT_VECTOR': 1,
+    'FLOAT_COLOR': 2,
+    'BYTE_COLOR': 2,
+}
+# Number of components of captured values to the value of 'Type' input of quick view
+QUICK_VIEW_CAPTURED_TYPES = {1: 0, 2: 1, 3: 1, 4: 2}
+# Socket types viewed as single numbers, only those can be filtered by value
+SCALAR_SOCKET_TYPES = (
+    bpy.types.NodeSocketFloat,
+    bpy.types.NodeSocketInt,
+    bpy.types.NodeSocketBool
+)
 
 
 def get_readable_viewer_name(name: str):
@@ -143,6 +232,45 @@ class Preferences(bpy.types.AddonPreferences):
         default=True
     )
 
+    filter_mode: bpy.props.EnumProperty(
+        name="Filter",
+        description="What elements to label when viewing single number attribute using "
+        "'ViewAttribute' operator",
+        items=(
+            ('NONE', "None", "Label all elements"),
+            ('HIGHEST', "Highest", "Label only elements with the highest values (Blender 4.1+)"),
+            ('LOWEST', "Lowest", "Label only elements with the lowest values (Blender 4.1+)"),
+            ('OUTSIDE_RANGE', "Outside Range", "Label only elements with values outside of range"),
+            ('NON_FINITE', "Non-Finite", "Label only elements with NaN or infinite values"),
+        ),
+        default='NONE'
+    )
+
+    filter_count: bpy.props.IntProperty(
+        name="Count",
+        description="How many highest or lowest values to label. Domains with more than 16.7 "
+        "million (2^24) elements may get fewer of them labelled",
+        default=10,
+        min=0
+    )
+
+    filter_min: bpy.props.FloatProperty(
+        name="Min",
+        default=0.0
+    )
+
+    filter_max: bpy.props.FloatProperty(
+        name="Max",
+        default=1.0
+    )
+
+    gate_shared_trees: bpy.props.BoolProperty(
+        name="Only Active Object in Shared Trees",
+        description="When viewing attribute in node tree used by more objects, generate the "
+        "labels only on the active object. Other objects can be allowed by 'Show Viewers On'",
+        default=True
+    )
+
     collapse_default_settings: bpy.props.BoolProperty()
 
     default_color_viewer: bpy.props.EnumProperty(
@@ -152,6 +280,13 @@ class Preferences(bpy.types.AddonPreferences):
         default=1,
     )
 
+    default_float_viewer: bpy.props.EnumProperty(
+        name="Default Float Viewer",
+        description="What 'Float Viewer' to spawn when using 'ViewAttribute' operator",
+        items=lambda self, _: self.get_default_viewer_enum_items(bpy.types.NodeSocketFloat),
+        default=0,
+    )
+
     default_vector_viewer: bpy.props.EnumProperty(
         name="Default Vector Viewer",
         description="What 'Vector Viewer' to spawn when using 'ViewAttribute' operator",
@@ -161,7 +296,8 @@ class Preferences(bpy.types.AddonPreferences):
 
     dimensions_scaling: bpy.props.BoolProperty(
         name="Dimensions Based Scaling",
-        description="If toggled then text scale is set based on maximum dimension of object",
+        description="If toggled then text scale is set based on spacing of the elements and "
+        "maximum dimension of object and is kept up to date when the geometry changes",
         default=True
     )
 
@@ -182,6 +318,8 @@ class Preferences(bpy.types.AddonPreferences):
             return self.default_color_viewer
         elif socket_type == bpy.types.NodeSocketVector:
             return self.default_vector_viewer
+        elif issubclass(socket_type, SCALAR_SOCKET_TYPES):
+            return self.default_float_viewer
         else:
             for name, viewer_socket_types in VIEWER_NAMES.items():
                 if socket_type in viewer_socket_types:
@@ -198,12 +336,23 @@ class Preferences(bpy.types.AddonPreferences):
         row.alignment = 'LEFT'
         row.label(text="(What viewer to spawn when viewing automatically)")
         col = layout.column()
+        col.prop(self, "default_float_viewer")
         col.prop(self, "default_vector_viewer")
         col.prop(self, "default_color_viewer")
+        col.prop(self, "filter_mode")
+        if not is_filter_mode_supported(self.filter_mode):
+            col.label(text="Highest and Lowest filters need Blender 4.1 or newer", icon='ERROR')
+        if self.filter_mode in {'HIGHEST', 'LOWEST'}:
+            col.prop(self, "filter_count")
+        elif self.filter_mode == 'OUTSIDE_RANGE':
+            row = col.row(align=True)
+            row.prop(self, "filter_min")
+            row.prop(self, "filter_max")
 
         col = layout.column()
         col.prop(self, "dimensions_scaling")
         col.prop(self, "scale")
+        col.prop(self, "gate_shared_trees")
 
         row = layout.row(align=True)
         icon = 'TRIA_RIGHT' if self.collapse_default_settings else 'TRIA_DOWN'
@@ -269,6 +418,12 @@ class Preferences(bpy.types.AddonPreferences):
             **{p:p.replace("_", " ") for p in self_named_props}
         }
 
+    def apply_filter_defaults(self, node: bpy.types.GeometryNodeGroup) -> None:
+        node.inputs["Mode"].default_value = node_groups.FILTER_MODES.index(self.filter_mode)
+        node.inputs["Count"].default_value = self.filter_count
+        node.inputs["Min"].default_value = self.filter_min
+        node.inputs["Max"].default_value = self.filter_max
+
 
 def get_preferences(context: typing.Optional[bpy.types.Context] = None) -> Preferences:
     if context is None:
@@ -284,10 +439,16 @@ def get_geonodes_path() -> str:
 def ensure_viewer_nodes_loaded(link: bool = True):
     with bpy.data.libraries.load(get_geonodes_path(), link=link) as (data_from, data_to):
         for node_group_name in VIEWER_NAMES:
+            if node_group_name in node_groups.BUILDERS:
+                continue
+
             if node_group_name not in bpy.data.node_groups:
                 assert node_group_name in data_from.node_groups
                 data_to.node_groups.append(node_group_name)
 
+    # Built groups can use the loaded ones and their materials, so they are built afterwards
+    node_groups.ensure_node_groups_built()
+
 
 def filter_applicable_sockets(
     node_outputs: typing.Iterable[bpy.types.NodeSocket]
@@ -323,14 +484,28 @@ def is_socket_connected_to_viewer(
     """
     to_socket_names = ("Attribute", "Geometry") if check_geometry_socket else ("Attribute")
     for link in node_tree.links:
-        if link.from_socket == from_socket and \
-                is_viewer_node(link.to_node) and \
-                link.to_socket.name in to_socket_names:
-            return True
+        if link.from_socket != from_socket:
+            continue
+
+        for _, to_socket in iter_linked_viewers(link):
+            if to_socket.name in to_socket_names:
+                return True
 
     return False
 
 
+def iter_linked_viewers(
+    link: bpy.types.NodeLink
+) -> typing.Iterator[typing.Tuple[bpy.types.GeometryNodeGroup, bpy.types.NodeSocket]]:
+    """Yields viewers and their sockets 'link' leads to, following it through geometry gate"""
+    if is_viewer_helper(link.to_node, GATE_HELPER):
+        for gate_link in link.to_node.outputs["Geometry"].links:
+            if is_viewer_node(gate_link.to_node):
+                yield gate_link.to_node, gate_link.to_socket
+    elif is_viewer_node(link.to_node):
+        yield link.to_node, link.to_socket
+
+
 def find_attribute_viewer_nodes_for_socket(
     node_tree: bpy.types.NodeTree,
     socket: bpy.types.NodeSocket
@@ -360,7 +535,10 @@ def find_attribute_viewer_nodes(
 
 def new_node_group(node_tree: bpy.types.NodeTree, name: str) -> bpy.types.NodeCustomGroup:
     node = node_tree.nodes.new(type='GeometryNodeGroup')
-    node_tree: bpy.types.GeometryNodeGroup = bpy.data.node_groups.get(name)
+    if name in node_groups.BUILDERS:
+        node_tree = node_groups.ensure_node_group(name)
+    else:
+        node_tree: bpy.types.GeometryNodeGroup = bpy.data.node_groups.get(name)
     node.node_tree = node_tree
     return node
 
@@ -413,6 +591,310 @@ def get_auto_attribute_viewer(
     return is_new, node_group
 
 
+def is_viewer_helper(node: bpy.types.Node, kind: typing.Optional[str] = None) -> bool:
+    helper_kind = node.get(VIEWER_HELPER_CUSTOM_PROP, None)
+    if kind is None:
+        return helper_kind is not None
+
+    return helper_kind == kind
+
+
+def iter_selection_helpers(viewer: bpy.types.GeometryNodeGroup) -> typing.Iterator[bpy.types.Node]:
+    """Yields helper nodes chained before 'Selection' input of 'viewer'
+
+    All helpers have 'Selection' input and output, so they can be chained in any order.
+    """
+    socket = viewer.inputs["Selection"]
+    while socket.is_linked:
+        node = socket.links[0].from_node
+        if not is_viewer_helper(node):
+            return
+
+        yield node
+        socket = node.inputs["Selection"]
+
+
+def find_selection_helper(
+    viewer: bpy.types.GeometryNodeGroup,
+    kind: str
+) -> typing.Optional[bpy.types.Node]:
+    for node in iter_selection_helpers(viewer):
+        if is_viewer_helper(node, kind):
+            return node
+
+    return None
+
+
+def insert_selection_helper(
+    node_tree: bpy.types.NodeTree,
+    viewer: bpy.types.GeometryNodeGroup,
+    node_group_name: str,
+    kind: str
+) -> bpy.types.GeometryNodeGroup:
+    selection = viewer.inputs["Selection"]
+    helper = new_node_group(node_tree, node_group_name)
+    helper[VIEWER_HELPER_CUSTOM_PROP] = kind
+    helper.label = get_readable_viewer_name(node_group_name)
+    helper.location = (viewer.location.x - 200, viewer.location.y - 200)
+    if selection.is_linked:
+        node_tree.links.new(selection.links[0].from_socket, helper.inputs["Selection"])
+    node_tree.links.new(helper.outputs["Selection"], selection)
+    return helper
+
+
+def remove_viewer_helper(node_tree: bpy.types.NodeTree, helper: bpy.types.Node) -> None:
+    # Reconnect what passes through the helper, e.g. 'Selection' or 'Geometry', or keep its
+    # value if it isn't linked, e.g. 'Domain'
+    for output in helper.outputs:
+        input_ = helper.inputs.get(output.name)
+        if input_ is None:
+            continue
+
+        for link in list(output.links):
+            if input_.is_linked:
+                node_tree.links.new(input_.links[0].from_socket, link.to_socket)
+            elif hasattr(input_, "default_value"):
+                link.to_socket.default_value = input_.default_value
+
+    node_tree.nodes.remove(helper)
+
+
+def remove_orphan_viewer_helpers(node_tree: bpy.types.NodeTree) -> None:
+    # Removing helper can orphan the one chained before it, repeat until nothing is removed
+    removed = True
+    while removed:
+        removed = False
+        for node in list(node_tree.nodes):
+            if is_viewer_helper(node) and not any(o.is_linked for o in node.outputs):
+                node_tree.nodes.remove(node)
+                removed = True
+
+
+def find_geometry_gate(viewer: bpy.types.GeometryNodeGroup) -> typing.Optional[bpy.types.Node]:
+    geometry = viewer.inputs[0]
+    if geometry.is_linked and is_viewer_helper(geometry.links[0].from_node, GATE_HELPER):
+        return geometry.links[0].from_node
+
+    return None
+
+
+def get_viewed_geometry_socket(
+    viewer: bpy.types.GeometryNodeGroup
+) -> typing.Optional[bpy.types.NodeSocket]:
+    """Returns socket of geometry viewed by 'viewer', skipping its gate"""
+    geometry = viewer.inputs[0]
+    gate = find_geometry_gate(viewer)
+    if gate is not None:
+        geometry = gate.inputs["Geometry"]
+
+    return geometry.links[0].from_socket if geometry.is_linked else None
+
+
+def link_viewer_geometry(
+    node_tree: bpy.types.NodeTree,
+    geometry_socket: bpy.types.NodeSocket,
+    viewer: bpy.types.GeometryNodeGroup
+) -> None:
+    gate = find_geometry_gate(viewer)
+    if gate is not None:
+        node_tree.links.new(geometry_socket, gate.inputs["Geometry"])
+        geometry_socket = gate.outputs["Geometry"]
+
+    node_tree.links.new(geometry_socket, viewer.inputs[0])
+    for helper in iter_selection_helpers(viewer):
+        geometry_input = helper.inputs.get("Geometry")
+        if geometry_input is not None:
+            node_tree.links.new(geometry_socket, geometry_input)
+
+
+def get_viewer_domain_socket(viewer: bpy.types.GeometryNodeGroup) -> bpy.types.NodeSocket:
+    """Returns socket setting the domain of 'viewer', helpers can pass it through to viewer"""
+    socket = viewer.inputs["Domain"]
+    while socket.is_linked and is_viewer_helper(socket.links[0].from_node):
+        socket = socket.links[0].from_node.inputs["Domain"]
+
+    return socket
+
+
+def is_filter_mode_supported(mode: str) -> bool:
+    return mode not in {'HIGHEST', 'LOWEST'} or node_groups.SORT_ELEMENTS_SUPPORTED
+
+
+def update_viewer_filter(
+    node_tree: bpy.types.NodeTree,
+    viewer: bpy.types.GeometryNodeGroup,
+    socket: bpy.types.NodeSocket
+) -> bool:
+    """Adds, updates or removes filter of 'viewer' based on preferences and viewed 'socket'
+
+    Returns False if the filter mode from preferences isn't supported by this Blender version.
+    """
+    prefs = get_preferences()
+    filter_node = find_selection_helper(viewer, FILTER_HELPER)
+    supported = is_filter_mode_supported(prefs.filter_mode)
+    if prefs.filter_mode == 'NONE' or not supported or not isinstance(socket, SCALAR_SOCKET_TYPES):
+        if filter_node is not None:
+            remove_viewer_helper(node_tree, filter_node)
+        return supported
+
+    if filter_node is None:
+        filter_node = insert_selection_helper(node_tree, viewer, node_groups.FILTER, FILTER_HELPER)
+        prefs.apply_filter_defaults(filter_node)
+        # Viewer takes the domain from the filter, so both always use the same one
+        domain = get_viewer_domain_socket(viewer)
+        filter_node.inputs["Domain"].default_value = domain.default_value
+        if domain.is_linked:
+            node_tree.links.new(domain.links[0].from_socket, filter_node.inputs["Domain"])
+        node_tree.links.new(filter_node.outputs["Domain"], viewer.inputs["Domain"])
+
+    node_tree.links.new(socket, filter_node.inputs["Attribute"])
+    if viewer.inputs[0].is_linked:
+        node_tree.links.new(viewer.inputs[0].links[0].from_socket, filter_node.inputs["Geometry"])
+
+    return True
+
+
+def get_node_tree_users(
+    node_tree: bpy.types.NodeTree
+) -> typing.List[typing.Tuple[bpy.types.Object, bpy.types.NodesModifier]]:
+    users = []
+    for obj in bpy.data.objects:
+        for modifier in obj.modifiers:
+            if modifier.type == 'NODES' and modifier.node_group == node_tree:
+                users.append((obj, modifier))
+
+    return users
+
+
+def get_group_input_socket(node_tree: bpy.types.NodeTree, name: str) -> bpy.types.NodeSocket:
+    for node in node_tree.nodes:
+        if isinstance(node, bpy.types.NodeGroupInput) and name in node.outputs:
+            return node.outputs[name]
+
+    # Sockets of existing group input nodes can be updated only after the interface change is
+    # evaluated, new node has them right away
+    group_input = node_tree.nodes.new('NodeGroupInput')
+    locations = [node.location.x for node in node_tree.nodes if node != group_input]
+    group_input.location = (min(locations, default=0.0) - 200, 0.0)
+    return group_input.outputs[name]
+
+
+def gate_viewer(node_tree: bpy.types.NodeTree, viewer: bpy.types.GeometryNodeGroup) -> None:
+    gate_socket = get_group_input_socket(node_tree, GATE_INPUT_NAME)
+    # Empty geometry can't be output in place of the viewed one, so viewers replacing geometry
+    # pass it through unchanged when disabled
+    if replaces_geometry(viewer):
+        node_tree.links.new(gate_socket, viewer.inputs["Enabled"])
+        return
+
+    gate = find_geometry_gate(viewer)
+    if gate is None:
+        geometry_socket = get_viewed_geometry_socket(viewer)
+        gate = new_node_group(node_tree, node_groups.GATE)
+        gate[VIEWER_HELPER_CUSTOM_PROP] = GATE_HELPER
+        gate.label = get_readable_viewer_name(node_groups.GATE)
+        gate.location = (viewer.location.x - 200, viewer.location.y + 100)
+        node_tree.links.new(gate.outputs["Geometry"], viewer.inputs[0])
+        if geometry_socket is not None:
+            link_viewer_geometry(node_tree, geometry_socket, viewer)
+
+    node_tree.links.new(gate_socket, gate.inputs["Enabled"])
+
+
+def set_viewer_gate(
+    node_tree: bpy.types.NodeTree,
+    allowed: typing.Optional[typing.Set[bpy.types.Object]]
+) -> None:
+    """Enables viewers of 'node_tree' only on 'allowed' objects, or on all its users if None"""
+    gate_input = node_groups.find_interface_input(node_tree, GATE_INPUT_NAME)
+    if allowed is None:
+        for node in list(node_tree.nodes):
+            if is_viewer_helper(node, GATE_HELPER):
+                remove_viewer_helper(node_tree, node)
+
+        for viewer in find_attribute_viewer_nodes(node_tree):
+            if replaces_geometry(viewer):
+                enabled = viewer.inputs["Enabled"]
+                for link in list(enabled.links):
+                    node_tree.links.remove(link)
+                enabled.default_value = True
+
+        if gate_input is not None:
+            node_groups.remove_interface_input(node_tree, gate_input)
+        return
+
+    if gate_input is None:
+        gate_input = node_groups.new_interface_socket(
+            node_tree, 'INPUT', 'NodeSocketBool', GATE_INPUT_NAME)
+        gate_input.default_value = False
+        gate_input.description = "Generate attribute viewer labels for this object"
+
+    for viewer in find_attribute_viewer_nodes(node_tree):
+        gate_viewer(node_tree, viewer)
+
+    identifier = node_groups.get_input_identifier(node_tree, GATE_INPUT_NAME)
+    for obj, modifier in get_node_tree_users(node_tree):
+        modifier[identifier] = obj in allowed
+        # Setting ID properties doesn't tag the object for update on its own
+        obj.update_tag()
+
+
+def update_viewer_gate(context: bpy.types.Context, node_tree: bpy.types.NodeTree) -> None:
+    """Gates viewers of 'node_tree' shared by more objects, so only the active one pays for them"""
+    obj = safe_get_active_object(context)
+    users = get_node_tree_users(node_tree)
+    if node_groups.find_interface_input(node_tree, GATE_INPUT_NAME) is None:
+        if get_preferences(context).gate_shared_trees and len({o for o, _ in users}) > 1:
+            set_viewer_gate(node_tree, {obj})
+        return
+
+    for viewer in find_attribute_viewer_nodes(node_tree):
+        gate_viewer(node_tree, viewer)
+
+    # Keep the objects allowed explicitly, only make sure the viewers show on the active one
+    identifier = node_groups.get_input_identifier(node_tree, GATE_INPUT_NAME)
+    for user, modifier in users:
+        if user == obj and not modifier.get(identifier, False):
+            modifier[identifier] = True
+            user.update_tag()
+
+
+def find_target_viewer(node_tree: bpy.types.NodeTree) -> typing.Optional[bpy.types.GeometryNodeGroup]:
+    """Returns active viewer node, or the automatic one, or any viewer in 'node_tree'"""
+    active_node = node_tree.nodes.active
+    if active_node is not None and is_viewer_node(active_node):
+        return active_node
+
+    viewers = list(find_attribute_viewer_nodes(node_tree))
+    for viewer in viewers:
+        if is_auto_viewer(viewer):
+            return viewer
+
+    return viewers[0] if len(viewers) > 0 else None
+
+
+def get_group_output_geometry_socket(
+    node_tree: bpy.types.NodeTree
+) -> typing.Optional[bpy.types.NodeSocketGeometry]:
+    for node in node_tree.nodes:
+        if not isinstance(node, bpy.types.NodeGroupOutput):
+            continue
+
+        for socket in node.inputs:
+            if isinstance(socket, bpy.types.NodeSocketGeometry):
+                return socket
+
+    return None
+
+
+def get_attribute_data_type(socket: bpy.types.NodeSocket) -> typing.Optional[str]:
+    for socket_type, data_type in SOCKET_ATTRIBUTE_TYPES:
+        if isinstance(socket, socket_type):
+            return data_type
+
+    return None
+
+
 def get_first_geometry_output(
     node: bpy.types.Node
 ) -> typing.Optional[bpy.types.NodeSocketGeometry]:
@@ -430,30 +912,587 @@ def safe_get_active_object(context: bpy.types.Context) -> typing.Optional[bpy.ty
     return context.active_object
 
 
-def adjust_viewer_text_size(
+# Object name to the estimated spacing of its evaluated elements, invalidated on geometry update
+ELEMENT_SPACING_CACHE: typing.Dict[str, typing.Optional[float]] = {}
+# Object name to enum items of attributes of its evaluated mesh, invalidated on geometry update
+ATTRIBUTE_ITEMS_CACHE: typing.Dict[str, typing.List[typing.Tuple[str, str, str]]] = {}
+# Object name to enum items of attributes and vertex groups viewable by quick view
+QUICK_VIEW_ITEMS_CACHE: typing.Dict[str, typing.List[typing.Tuple[str, str, str]]] = {}
+# (Object name, attribute name, sort) to the order of elements and their sorted keys
+TABLE_ORDER_CACHE: typing.Dict[
+    typing.Tuple[str, str, str],
+    typing.Tuple[np.ndarray, np.ndarray]
+] = {}
+
+
+def sample_element_indices(count: int) -> np.ndarray:
+    """Returns evenly strided indices of at most about 'SPACING_SAMPLE_SIZE' of 'count' elements"""
+    return np.arange(0, count, max(1, count // SPACING_SAMPLE_SIZE))
+
+
+def read_element_values(
+    collection: bpy.types.bpy_prop_collection,
+    prop: str,
+    components: int,
+    indices: np.ndarray,
+    dtype: typing.Type = np.float32
+) -> np.ndarray:
+    """Reads 'prop' of elements at 'indices' of 'collection' to array of shape (len(indices), components)
+
+    Small collections are bulk read, huge ones only element by element at 'indices', so the
+    cost is bounded by the number of sampled elements and not by the size of the geometry.
+    """
+    if len(collection) <= SPACING_BULK_READ_SIZE:
+        values = np.empty(len(collection) * components, dtype=dtype)
+        collection.foreach_get(prop, values)
+        return values.reshape(-1, components)[indices]
+
+    values = [getattr(collection[i], prop)[:] for i in indices.tolist()]
+    return np.array(values, dtype=dtype).reshape(-1, components)
+
+
+def estimate_element_spacing(
+    obj: bpy.types.Object,
+    depsgraph: bpy.types.Depsgraph
+) -> typing.Optional[float]:
+    """Estimates average distance between elements of evaluated 'obj' in its local space
+
+    Only a strided sample of edges, or of points if there are no edges, is read, so huge
+    meshes don't slow down the depsgraph handler. Returns None if the evaluated object has
+    no mesh data to estimate from.
+    """
+    evaluated = obj.evaluated_get(depsgraph)
+    if evaluated.type != 'MESH' or len(evaluated.data.vertices) == 0:
+        return None
+
+    mesh: bpy.types.Mesh = evaluated.data
+    # Geometry generated by viewers has color for 'AV_Material', don't measure the labels
+    color_attribute = mesh.attributes.get(node_groups.COLOR_ATTRIBUTE)
+    if color_attribute is not None and color_attribute.domain != 'POINT':
+        color_attribute = None
+
+    def read_original_mask(vertices: np.ndarray) -> typing.Optional[np.ndarray]:
+        if color_attribute is None:
+            return None
+        return read_element_values(color_attribute.data, "color", 4, vertices)[:, 3] == 0.0
+
+    if len(mesh.edges) > 0:
+        edges = read_element_values(
+            mesh.edges, "vertices", 2, sample_element_indices(len(mesh.edges)), np.int32)
+        # Read only the vertices of the sampled edges, 'edges' then index into them
+        vertices, edges = np.unique(edges, return_inverse=True)
+        edges = edges.reshape(-1, 2)
+        positions = read_element_values(mesh.vertices, "co", 3, vertices)
+        original_mask = read_original_mask(vertices)
+        if original_mask is not None:
+            edges = edges[original_mask[edges[:, 0]] & original_mask[edges[:, 1]]]
+
+        lengths = np.linalg.norm(positions[edges[:, 0]] - positions[edges[:, 1]], axis=1)
+        lengths = lengths[lengths > 0.0]
+        if len(lengths) > 0:
+            return float(np.median(lengths))
+
+    # No edges to measure, assume the points are evenly spread in their bounding box
+    vertices = sample_element_indices(len(mesh.vertices))
+    positions = read_element_values(mesh.vertices, "co", 3, vertices)
+    count = len(mesh.vertices)
+    original_mask = read_original_mask(vertices)
+    if original_mask is not None:
+        if not original_mask.any():
+            return None
+        positions = positions[original_mask]
+        # Estimate the number of original points from the sampled ratio
+        count = max(1, round(count * len(positions) / len(vertices)))
+
+    extents = np.ptp(positions, axis=0)
+    extents = extents[extents > 0.0]
+    if len(extents) == 0:
+        return None
+
+    return float((np.prod(extents) / count) ** (1.0 / len(extents)))
+
+
+def get_element_spacing(
+    obj: bpy.types.Object,
+    depsgraph: typing.Optional[bpy.types.Depsgraph] = None
+) -> typing.Optional[float]:
+    if obj.name not in ELEMENT_SPACING_CACHE:
+        if depsgraph is None:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+        ELEMENT_SPACING_CACHE[obj.name] = estimate_element_spacing(obj, depsgraph)
+
+    return ELEMENT_SPACING_CACHE[obj.name]
+
+
+def get_size_factor(
     obj: typing.Optional[bpy.types.Object],
-    viewer: bpy.types.GeometryNodeGroup
-):
+    depsgraph: typing.Optional[bpy.types.Depsgraph] = None
+) -> float:
     size_factor = 1.0
     if get_preferences(bpy.context).dimensions_scaling and obj is not None:
-        size_factor = max(obj.dimensions)
-    
-    if obj is None or math.isclose(size_factor, 0.0) or size_factor < 0:
+        # Viewer geometry lives in object space, so measure in it and let the object scale
+        # scale the labels together with the geometry.
+        local_corners = np.array(obj.bound_box)
+        size_factor = float(np.ptp(local_corners, axis=0).max())
+        spacing = get_element_spacing(obj, depsgraph)
+        if spacing is not None:
+            size_factor = min(size_factor, spacing * SPACING_SCALE_FACTOR / GLOBAL_SCALE_FACTOR)
+
+    if math.isclose(size_factor, 0.0) or size_factor < 0:
         size_factor = 1.0
 
-    # No autoscale for unapplied scale
-    if obj is not None and not (math.isclose(obj.scale.x, 1.0) and
-            math.isclose(obj.scale.y, 1.0) and
-            math.isclose(obj.scale.z, 1.0)):
-        return
+    return size_factor
 
+
+def get_text_size(
+    obj: typing.Optional[bpy.types.Object],
+    viewer: bpy.types.GeometryNodeGroup,
+    depsgraph: typing.Optional[bpy.types.Depsgraph] = None
+) -> float:
+    size_factor = get_size_factor(obj, depsgraph)
     # Default size is larger for the vector, so it looks nicer
     if viewer.node_tree.name == "AV_Vector":
         size_factor *= 3.0
 
-    text_size = size_factor * GLOBAL_SCALE_FACTOR * get_preferences().scale
+    return size_factor * GLOBAL_SCALE_FACTOR * get_preferences().scale
+
+
+def adjust_viewer_text_size(
+    obj: typing.Optional[bpy.types.Object],
+    viewer: bpy.types.GeometryNodeGroup
+):
     input: bpy.types.NodeSocketFloat = viewer.inputs.get("Scale")
+    # Some viewers, such as heatmap, don't generate any text
+    if input is None:
+        return
+
+    text_size = get_text_size(obj, viewer)
     input.default_value = text_size
+    if get_preferences(bpy.context).dimensions_scaling:
+        viewer[AUTO_SCALE_CUSTOM_PROP] = input.default_value
+
+
+def readjust_auto_scaled_viewers(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph) -> None:
+    """Updates the text size of viewers of 'obj' that was set automatically to its new geometry
+
+    Writing the 'Scale' input re-evaluates the modifier and triggers another geometry update
+    of 'obj', so this is called again from 'depsgraph_update_post'. The loop ends because the
+    text size is written only if it differs from the last automatic one by more than the
+    tolerance, and the re-evaluated labels don't change the estimate, as their points are
+    excluded from it.
+    """
+    for modifier in obj.modifiers:
+        if modifier.type != 'NODES' or modifier.node_group is None:
+            continue
+
+        for viewer in find_attribute_viewer_nodes(modifier.node_group):
+            auto_scale = viewer.get(AUTO_SCALE_CUSTOM_PROP, None)
+            if auto_scale is None:
+                continue
+
+            input: bpy.types.NodeSocketFloat = viewer.inputs.get("Scale")
+            # Scale was changed by the user, don't override it anymore
+            if not math.isclose(input.default_value, auto_scale, rel_tol=1e-4):
+                del viewer[AUTO_SCALE_CUSTOM_PROP]
+                continue
+
+            text_size = get_text_size(obj, viewer, depsgraph)
+            # Tolerance, so small changes of the geometry and of the sampled estimate don't
+            # retrigger the evaluation, each write causes another update, see the docstring
+            if not math.isclose(text_size, auto_scale, rel_tol=0.05):
+                input.default_value = text_size
+                viewer[AUTO_SCALE_CUSTOM_PROP] = input.default_value
+
+
+def invalidate_object_caches(obj: bpy.types.Object) -> None:
+    ELEMENT_SPACING_CACHE.pop(obj.name, None)
+    ATTRIBUTE_ITEMS_CACHE.pop(obj.name, None)
+    QUICK_VIEW_ITEMS_CACHE.pop(obj.name, None)
+    for key in [k for k in TABLE_ORDER_CACHE if k[0] == obj.name]:
+        del TABLE_ORDER_CACHE[key]
+
+
+@bpy.app.handlers.persistent
+def depsgraph_update_post(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    active_object = safe_get_active_object(bpy.context)
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry or not isinstance(update.id, bpy.types.Object):
+            continue
+
+        obj = update.id.original
+        invalidate_object_caches(obj)
+        # Viewer nodes can be in node tree shared by many objects, only the active one is
+        # considered to not fight over the scale
+        if obj == active_object and get_preferences(bpy.context).dimensions_scaling:
+            readjust_auto_scaled_viewers(obj, depsgraph)
+
+
+def read_attribute_values(attribute: bpy.types.Attribute) -> np.ndarray:
+    """Bulk reads values of 'attribute' to array of shape (len(attribute.data), components)"""
+    value_prop, components = ATTRIBUTE_VALUE_PROPS[attribute.data_type]
+    values = np.empty(
+        len(attribute.data) * components,
+        dtype=ATTRIBUTE_NUMPY_TYPES.get(attribute.data_type, np.float32)
+    )
+    attribute.data.foreach_get(value_prop, values)
+    return values.reshape(-1, components)
+
+
+def get_evaluated_mesh(
+    obj: typing.Optional[bpy.types.Object],
+    depsgraph: bpy.types.Depsgraph
+) -> typing.Optional[bpy.types.Mesh]:
+    if obj is None:
+        return None
+
+    evaluated = obj.evaluated_get(depsgraph)
+    if evaluated.type != 'MESH':
+        return None
+
+    return evaluated.data
+
+
+def get_attribute_enum_items(
+    obj: typing.Optional[bpy.types.Object]
+) -> typing.List[typing.Tuple[str, str, str]]:
+    if obj is None:
+        return []
+
+    if obj.name not in ATTRIBUTE_ITEMS_CACHE:
+        items = []
+        mesh = get_evaluated_mesh(obj, bpy.context.evaluated_depsgraph_get())
+        if mesh is not None:
+            for attribute in mesh.attributes:
+                # Internal attributes, such as '.select_vert', are hidden in the UI
+                if attribute.name.startswith(".") or \
+                        attribute.data_type not in ATTRIBUTE_VALUE_PROPS:
+                    continue
+
+                description = f"{attribute.domain.title()} {attribute.data_type.title()}"
+                items.append((attribute.name, attribute.name, description))
+
+        ATTRIBUTE_ITEMS_CACHE[obj.name] = items
+
+    return ATTRIBUTE_ITEMS_CACHE[obj.name]
+
+
+def get_table_order(
+    obj: bpy.types.Object,
+    attribute: bpy.types.Attribute,
+    sort: str
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Returns order of elements of 'attribute' sorted by 'sort' and their sorted keys
+
+    Elements with more components are sorted by their length.
+    """
+    key = (obj.name, attribute.name, sort)
+    if key not in TABLE_ORDER_CACHE:
+        values = read_attribute_values(attribute).astype(np.float64)
+        if values.shape[1] == 1:
+            sort_keys = values[:, 0]
+        else:
+            sort_keys = np.linalg.norm(values, axis=1)
+
+        if sort == 'INDEX':
+            order = np.arange(len(sort_keys))
+        else:
+            order = np.argsort(sort_keys, kind='stable')
+            if sort == 'DESCENDING':
+                order = order[::-1]
+
+        TABLE_ORDER_CACHE[key] = (order, sort_keys[order])
+
+    return TABLE_ORDER_CACHE[key]
+
+
+def read_table_rows(
+    obj: bpy.types.Object,
+    attribute: bpy.types.Attribute,
+    sort: str,
+    start: int,
+    end: int
+) -> typing.List[typing.Tuple[int, typing.Any]]:
+    """Reads only rows from 'start' to 'end' of the table, returns their indices and values"""
+    value_prop, components = ATTRIBUTE_VALUE_PROPS[attribute.data_type]
+    if sort == 'INDEX':
+        indices = range(start, end)
+        items = attribute.data[start:end]
+    else:
+        indices = [int(i) for i in get_table_order(obj, attribute, sort)[0][start:end]]
+        items = [attribute.data[i] for i in indices]
+
+    rows = []
+    for index, item in zip(indices, items):
+        value = getattr(item, value_prop)
+        rows.append((index, tuple(value) if components > 1 else value))
+
+    return rows
+
+
+def format_table_value(value: typing.Any, decimals: int) -> str:
+    if isinstance(value, tuple):
+        return ", ".join(format_table_value(v, decimals) for v in value)
+    if isinstance(value, float):
+        return f"{value:.{decimals}f}"
+
+    return str(value)
+
+
+def get_quick_view_source(obj: typing.Optional[bpy.types.Object]) -> typing.Optional[bpy.types.Object]:
+    """Returns object viewed by quick view 'obj', or 'obj' itself if it isn't quick view"""
+    if obj is None:
+        return None
+
+    return obj.get(QUICK_VIEW_SOURCE_CUSTOM_PROP, None) or obj
+
+
+def get_quick_view_enum_items(
+    obj: typing.Optional[bpy.types.Object]
+) -> typing.List[typing.Tuple[str, str, str]]:
+    obj = get_quick_view_source(obj)
+    if obj is None:
+        return []
+
+    if obj.name not in QUICK_VIEW_ITEMS_CACHE:
+        items = [
+            item for item in get_attribute_enum_items(obj)
+            if item[0] not in (node_groups.VIEWED_ATTRIBUTE, "position")
+        ]
+        # Vertex groups aren't part of the attributes API, but can be read as named attributes
+        items.extend((group.name, group.name, "Vertex Group") for group in obj.vertex_groups)
+        QUICK_VIEW_ITEMS_CACHE[obj.name] = items
+
+    return QUICK_VIEW_ITEMS_CACHE[obj.name]
+
+
+def ensure_quick_view_object(
+    context: bpy.types.Context,
+    source: bpy.types.Object
+) -> bpy.types.Object:
+    """Returns object viewing 'source' through the quick view node group, creates it if necessary"""
+    name = QUICK_VIEW_OBJECT_PREFIX + source.name
+    quick_view = bpy.data.objects.get(name)
+    if quick_view is None:
+        quick_view = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+        quick_view[QUICK_VIEW_SOURCE_CUSTOM_PROP] = source
+        quick_view.hide_select = True
+        quick_view.hide_render = True
+        constraint = quick_view.constraints.new('COPY_TRANSFORMS')
+        constraint.target = source
+
+    collections = source.users_collection or (context.scene.collection, )
+    if quick_view.name not in collections[0].objects:
+        collections[0].objects.link(quick_view)
+
+    modifier = quick_view.modifiers.get(node_groups.QUICK_VIEW)
+    if modifier is None:
+        modifier = quick_view.modifiers.new(node_groups.QUICK_VIEW, 'NODES')
+    modifier.node_group = node_groups.ensure_node_group(node_groups.QUICK_VIEW)
+    return quick_view
+
+
+def load_captured_values(source: bpy.types.Object, values: np.ndarray) -> bpy.types.Object:
+    """Stores captured 'values' of 'source' onto points of object sampled by quick view"""
+    type_ = QUICK_VIEW_CAPTURED_TYPES[values.shape[1]]
+    data_type = node_groups.QUICK_VIEW_TYPES[type_][0]
+    values = values.astype(np.float32)
+    # 2D vectors, such as UV maps, are stored as 3D vectors
+    if values.shape[1] == 2:
+        values = np.hstack((values, np.zeros((len(values), 1), dtype=np.float32)))
+
+    name = CAPTURED_OBJECT_PREFIX + source.name
+    mesh = bpy.data.meshes.get(name)
+    if mesh is not None and len(mesh.vertices) != len(values):
+        bpy.data.meshes.remove(mesh)
+        mesh = None
+
+    if mesh is None:
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(values))
+
+    captured = mesh.attributes.get(node_groups.CAPTURED_ATTRIBUTE)
+    if captured is not None and captured.data_type != data_type:
+        mesh.attributes.remove(captured)
+        captured = None
+    if captured is None:
+        captured = mesh.attributes.new(node_groups.CAPTURED_ATTRIBUTE, data_type, 'POINT')
+    captured.data.foreach_set(ATTRIBUTE_VALUE_PROPS[data_type][0], values.ravel())
+    mesh.update()
+
+    # Same as the diff snapshot, the object is only used through 'Object Info'
+    captured_object = bpy.data.objects.get(name)
+    if captured_object is None:
+        captured_object = bpy.data.objects.new(name, mesh)
+    else:
+        captured_object.data = mesh
+
+    return captured_object
+
+
+def set_modifier_input(modifier: bpy.types.NodesModifier, name: str, value: typing.Any) -> None:
+    modifier[node_groups.get_input_identifier(modifier.node_group, name)] = value
+
+
+def replaces_geometry(viewer: bpy.types.Node) -> bool:
+    return is_viewer_node(viewer) and viewer.node_tree.name.startswith(GEOMETRY_REPLACING_VIEWERS)
+
+
+def get_replaced_geometry_reconnections(
+    viewer: bpy.types.GeometryNodeGroup
+) -> typing.List[typing.Tuple[bpy.types.NodeSocket, bpy.types.NodeSocket]]:
+    """Returns links to create, so the viewed geometry is output again when 'viewer' is removed
+
+    Every user of the viewer result is reconnected, not only the group output, as the result
+    can also go through the 'Store Viewed' helper.
+    """
+    if not replaces_geometry(viewer) or not viewer.inputs[0].is_linked:
+        return []
+
+    from_socket = viewer.inputs[0].links[0].from_socket
+    return [(from_socket, link.to_socket) for link in viewer.outputs[0].links]
+
+
+def remove_viewer(node_tree: bpy.types.NodeTree, viewer: bpy.types.GeometryNodeGroup) -> None:
+    for from_socket, to_socket in get_replaced_geometry_reconnections(viewer):
+        node_tree.links.new(from_socket, to_socket)
+
+    node_tree.nodes.remove(viewer)
+
+
+def is_diff_viewer(node: bpy.types.Node) -> bool:
+    return is_viewer_node(node) and node.node_tree.name.startswith(node_groups.DIFF_VIEWER)
+
+
+def take_diff_snapshot(
+    obj: bpy.types.Object,
+    depsgraph: bpy.types.Depsgraph
+) -> typing.Optional[bpy.types.Object]:
+    """Stores values viewed by diff viewer on 'obj' into snapshot object and returns it
+
+    Returns None if there are no values stored by diff viewer on the evaluated 'obj'.
+    """
+    evaluated = obj.evaluated_get(depsgraph)
+    if evaluated.type != 'MESH':
+        return None
+
+    attributes = evaluated.data.attributes
+    value_attribute = attributes.get(node_groups.DIFF_VALUE_ATTRIBUTE)
+    mask_attribute = attributes.get(node_groups.DIFF_MASK_ATTRIBUTE)
+    if value_attribute is None or mask_attribute is None:
+        return None
+
+    # Joining keeps the order of elements, so masked values are in order of the viewed elements
+    values = read_attribute_values(value_attribute)[read_attribute_values(mask_attribute)[:, 0]]
+    name = f"AV_Snapshot_{obj.name}"
+    mesh = bpy.data.meshes.get(name)
+    if mesh is not None and len(mesh.vertices) != len(values):
+        bpy.data.meshes.remove(mesh)
+        mesh = None
+
+    if mesh is None:
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(values))
+
+    reference = mesh.attributes.get(node_groups.REFERENCE_ATTRIBUTE)
+    if reference is None:
+        reference = mesh.attributes.new(node_groups.REFERENCE_ATTRIBUTE, 'FLOAT', 'POINT')
+    reference.data.foreach_set("value", values.ravel())
+    mesh.update()
+
+    # The snapshot object is only used through 'Object Info', it isn't linked to any scene
+    snapshot = bpy.data.objects.get(name)
+    if snapshot is None:
+        snapshot = bpy.data.objects.new(name, mesh)
+    else:
+        snapshot.data = mesh
+
+    return snapshot
+
+
+# (Node tree name, viewer name) of diff viewers updated to the previous frame, so frame change
+# doesn't walk all the node trees. None until it is collected from the file, see
+# 'get_previous_frame_diff_viewers'.
+PREVIOUS_FRAME_DIFF_VIEWERS: typing.Optional[typing.Set[typing.Tuple[str, str]]] = None
+
+
+def get_previous_frame_diff_viewers() -> typing.Set[typing.Tuple[str, str]]:
+    """Returns keys of diff viewers with 'PREVIOUS_FRAME' reference, collects them once per file"""
+    global PREVIOUS_FRAME_DIFF_VIEWERS
+    if PREVIOUS_FRAME_DIFF_VIEWERS is None:
+        PREVIOUS_FRAME_DIFF_VIEWERS = set()
+        for node_tree in bpy.data.node_groups:
+            if node_tree.type != 'GEOMETRY' or node_tree.library is not None:
+                continue
+
+            for viewer in find_attribute_viewer_nodes(node_tree):
+                if viewer.get(DIFF_REFERENCE_CUSTOM_PROP, None) == 'PREVIOUS_FRAME':
+                    PREVIOUS_FRAME_DIFF_VIEWERS.add((node_tree.name, viewer.name))
+
+    return PREVIOUS_FRAME_DIFF_VIEWERS
+
+
+def set_diff_reference(
+    viewer: bpy.types.GeometryNodeGroup,
+    reference: str,
+    snapshot: typing.Optional[bpy.types.Object] = None,
+    obj: typing.Optional[bpy.types.Object] = None
+) -> None:
+    viewer.inputs["Reference Object"].default_value = snapshot
+    viewer[DIFF_REFERENCE_CUSTOM_PROP] = reference
+    if obj is not None:
+        viewer[DIFF_OBJECT_CUSTOM_PROP] = obj.name
+    elif DIFF_OBJECT_CUSTOM_PROP in viewer:
+        del viewer[DIFF_OBJECT_CUSTOM_PROP]
+
+    key = (viewer.id_data.name, viewer.name)
+    if reference == 'PREVIOUS_FRAME':
+        get_previous_frame_diff_viewers().add(key)
+    else:
+        get_previous_frame_diff_viewers().discard(key)
+
+
+@bpy.app.handlers.persistent
+def diff_load_post(*args):
+    global PREVIOUS_FRAME_DIFF_VIEWERS
+    PREVIOUS_FRAME_DIFF_VIEWERS = None
+
+
+@bpy.app.handlers.persistent
+def diff_frame_change_pre(scene: bpy.types.Scene, *args):
+    """Updates the reference of diff viewers in 'PREVIOUS_FRAME' mode to the last evaluated frame
+
+    'frame_change_pre' runs after the scene frame is set, but before the depsgraph is evaluated
+    for it, so the evaluated objects still hold the values of the last evaluated frame. This
+    is verified by the frame of the evaluated scene, the snapshot is skipped if it already is
+    the new frame. When jumping over frames, the last evaluated frame isn't 'frame - 1'.
+    """
+    viewer_keys = get_previous_frame_diff_viewers()
+    if len(viewer_keys) == 0:
+        return
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    if depsgraph.scene_eval.frame_current == scene.frame_current:
+        return
+
+    snapshots: typing.Dict[str, typing.Optional[bpy.types.Object]] = {}
+    for key in list(viewer_keys):
+        node_tree_name, viewer_name = key
+        node_tree = bpy.data.node_groups.get(node_tree_name)
+        viewer = node_tree.nodes.get(viewer_name) if node_tree is not None else None
+        # Viewer was removed, renamed or its reference changed without 'set_diff_reference'
+        if viewer is None or viewer.get(DIFF_REFERENCE_CUSTOM_PROP, None) != 'PREVIOUS_FRAME':
+            viewer_keys.discard(key)
+            continue
+
+        obj = scene.objects.get(viewer.get(DIFF_OBJECT_CUSTOM_PROP, ""))
+        if obj is None:
+            continue
+
+        if obj.name not in snapshots:
+            snapshots[obj.name] = take_diff_snapshot(obj, depsgraph)
+
+        if snapshots[obj.name] is not None:
+            viewer.inputs["Reference Object"].default_value = snapshots[obj.name]
 
 
 def mouse_to_region_coords(
@@ -506,7 +1545,11 @@ class AV_ViewAttribute(GeoNodesEditorOnlyMixin, bpy.types.Operator):
                 # switch the geometry input of the attribute viewer if there is any present
                 all_attribute_viewers = list(find_attribute_viewer_nodes(node_tree))
                 for viewer in all_attribute_viewers:
-                    node_tree.links.new(geometry_socket, viewer.inputs[0])
+                    # Viewers replacing geometry sit between the final geometry and the output,
+                    # relinking them would lose the original output link for good
+                    if replaces_geometry(viewer):
+                        continue
+                    link_viewer_geometry(node_tree, geometry_socket, viewer)
 
             if len(viewable_sockets) == 0:
                 return {'FINISHED'}
@@ -520,7 +1563,7 @@ class AV_ViewAttribute(GeoNodesEditorOnlyMixin, bpy.types.Operator):
             for link in list(node_tree.links):
                 if is_viewer_node(link.to_node) and \
                         isinstance(link.to_socket, bpy.types.NodeSocketGeometry):
-                    prev_geometry_socket = link.from_socket
+                    prev_geometry_socket = get_viewed_geometry_socket(link.to_node)
                     break
 
             # Disconnect other sockets going to viewer and connect this one
@@ -535,14 +1578,19 @@ class AV_ViewAttribute(GeoNodesEditorOnlyMixin, bpy.types.Operator):
                 if is_viewer_node(node) and \
                         is_auto_viewer(node) and \
                         not isinstance(node.inputs["Attribute"], type(socket_to_view)):
-                    node_tree.nodes.remove(node)
+                    remove_viewer(node_tree, node)
+            remove_orphan_viewer_helpers(node_tree)
 
             socket_to_view = viewable_sockets[idx]
             is_new, attribute_viewer = get_auto_attribute_viewer(node_tree, socket_to_view)
             mark_auto_viewer(attribute_viewer)
-            if prev_geometry_socket:
-                node_tree.links.new(prev_geometry_socket, attribute_viewer.inputs[0])
+            # Geometry of viewer replacing geometry is linked only from the output below
+            if prev_geometry_socket and not replaces_geometry(attribute_viewer):
+                link_viewer_geometry(node_tree, prev_geometry_socket, attribute_viewer)
             node_tree.links.new(socket_to_view, attribute_viewer.inputs["Attribute"])
+            if not update_viewer_filter(node_tree, attribute_viewer, socket_to_view):
+                self.report({'WARNING'}, "Highest and Lowest filters need Blender 4.1 or newer")
+            update_viewer_gate(context, node_tree)
 
             if prev_viewer and is_new:
                 attribute_viewer.location = prev_viewer.location
@@ -565,6 +1613,20 @@ class AV_ViewAttribute(GeoNodesEditorOnlyMixin, bpy.types.Operator):
                     output_geo_socket = socket
                     break
 
+                # Viewers are connected before the stored viewed attribute, so it isn't joined
+                # with the viewer geometry
+                if output_geo_socket.is_linked and \
+                        is_viewer_helper(output_geo_socket.links[0].from_node, STORE_HELPER):
+                    output_geo_socket = output_geo_socket.links[0].from_node.inputs["Geometry"]
+
+            if output_node is not None and replaces_geometry(attribute_viewer):
+                # View the geometry going to the output and output the viewer result instead
+                if output_geo_socket.is_linked and \
+                        output_geo_socket.links[0].from_node != attribute_viewer:
+                    link_viewer_geometry(
+                        node_tree, output_geo_socket.links[0].from_socket, attribute_viewer)
+                node_tree.links.new(attribute_viewer.outputs[0], output_geo_socket)
+            elif output_node is not None:
                 join_geo_node = None
                 for link in node_tree.links:
                     if not isinstance(link.from_node, bpy.types.GeometryNodeJoinGeometry):
@@ -644,9 +1706,10 @@ class AV_RemoveViewer(GeoNodesEditorOnlyMixin, bpy.types.Operator):
             ] = {}
 
             for link in node_tree.links:
-                if link.from_socket in viewer_connected_sockets and is_viewer_node(link.to_node):
-                    AV_RemoveViewer.nodes_to_remove.add(link.to_node)
-                    AV_RemoveViewer.links_to_remove.add(link)
+                if link.from_socket in viewer_connected_sockets:
+                    for viewer, _ in iter_linked_viewers(link):
+                        AV_RemoveViewer.nodes_to_remove.add(viewer)
+                        AV_RemoveViewer.links_to_remove.add(link)
 
                 # Remove join geometry node that's connected only to viewers
                 if isinstance(link.to_node, bpy.types.GeometryNodeJoinGeometry) and \
@@ -678,6 +1741,9 @@ class AV_RemoveViewer(GeoNodesEditorOnlyMixin, bpy.types.Operator):
                             from_socket = incoming_links[0].from_socket
                         AV_RemoveViewer.reconnections.add((from_socket, outgoing_links[0].to_socket))
                         AV_RemoveViewer.nodes_to_remove.add(jg_node)
+
+            for viewer in AV_RemoveViewer.__get_viewers_to_remove():
+                AV_RemoveViewer.reconnections.update(get_replaced_geometry_reconnections(viewer))
             
             # Don't invoke prompt if there is simple case that is obvious
             if len(AV_RemoveViewer.__get_viewers_to_remove()) <= 1:
@@ -710,6 +1776,8 @@ class AV_RemoveViewer(GeoNodesEditorOnlyMixin, bpy.types.Operator):
         for node in AV_RemoveViewer.nodes_to_remove:
             node_tree.nodes.remove(node)
 
+        remove_orphan_viewer_helpers(node_tree)
+
     @classmethod
     def __get_viewers_to_remove(cls) -> typing.List[bpy.types.Node]:
         return [n for n in cls.nodes_to_remove if is_viewer_node(n)]
@@ -748,6 +1816,7 @@ class AV_AddViewer(GeoNodesEditorOnlyMixin, bpy.types.Operator):
         ensure_viewer_nodes_loaded()
         viewer = new_attribute_viewer_from_name(node_tree, self.viewer_type)
         viewer.location = self.mouse_position
+        update_viewer_gate(context, node_tree)
         adjust_viewer_text_size(
             safe_get_active_object(context),
             viewer
@@ -772,23 +1841,590 @@ class AV_RemoveAllViewers(GeoNodesEditorOnlyMixin, bpy.types.Operator):
         node_tree = space.node_tree
         for node in list(node_tree.nodes):
             if is_viewer_node(node):
-                node_tree.nodes.remove(node)
+                remove_viewer(node_tree, node)
+
+        for node in list(node_tree.nodes):
+            if is_viewer_helper(node):
+                remove_viewer_helper(node_tree, node)
 
+        set_viewer_gate(node_tree, None)
         return {'FINISHED'}
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
         return context.window_manager.invoke_confirm(self, event)
 
 
-class AV_QuickView(GeoNodesEditorOnlyMixin, bpy.types.Operator):
+class AV_SetDiffReference(GeoNodesEditorOnlyMixin, bpy.types.Operator):
+    bl_idname = "attribute_viewer.set_diff_reference"
+    bl_label = "Set Diff Reference"
+    bl_description = "Sets what the diff viewers in active node tree compare the viewed " \
+        "attribute against"
+
+    reference: bpy.props.EnumProperty(
+        name="Reference",
+        items=(
+            ('SNAPSHOT', "Snapshot", "Compare against values of the active object stored now"),
+            ('PREVIOUS_FRAME', "Previous Frame", "Compare against values of the previous frame"),
+            ('SOCKET', "Reference Socket", "Compare against the 'Reference' input"),
+        )
+    )
+
+    def execute(self, context: bpy.types.Context):
+        space: bpy.types.SpaceNodeEditor = context.space_data
+        node_tree = space.node_tree
+        active_node = node_tree.nodes.active
+        if active_node is not None and is_diff_viewer(active_node):
+            diff_viewers = [active_node]
+        else:
+            diff_viewers = [n for n in find_attribute_viewer_nodes(node_tree) if is_diff_viewer(n)]
+
+        if len(diff_viewers) == 0:
+            self.report({'WARNING'}, "No diff viewer in the active node tree")
+            return {'CANCELLED'}
+
+        if self.reference == 'SOCKET':
+            for viewer in diff_viewers:
+                set_diff_reference(viewer, self.reference)
+            return {'FINISHED'}
+
+        obj = safe_get_active_object(context)
+        if obj is None:
+            self.report({'WARNING'}, "Active object is required to store the reference")
+            return {'CANCELLED'}
+
+        snapshot = take_diff_snapshot(obj, context.evaluated_depsgraph_get())
+        if snapshot is None:
+            self.report(
+                {'WARNING'},
+                "No values to store, the diff viewer has to output mesh with the original geometry"
+            )
+            return {'CANCELLED'}
+
+        for viewer in diff_viewers:
+            set_diff_reference(viewer, self.reference, snapshot, obj)
+
+        return {'FINISHED'}
+
+
+class AV_TableSettings(bpy.types.PropertyGroup):
+    attribute: bpy.props.EnumProperty(
+        name="Attribute",
+        description="Attribute of the evaluated active object listed in the table",
+        items=lambda self, context: get_attribute_enum_items(safe_get_active_object(context))
+    )
+
+    sort: bpy.props.EnumProperty(
+        name="Sort",
+        items=(
+            ('INDEX', "Index", "Elements in the order of their indices"),
+            ('ASCENDING', "Ascending", "Elements from the lowest value, vectors by their length"),
+            ('DESCENDING', "Descending", "Elements from the highest value, vectors by their length"),
+        )
+    )
+
+    rows: bpy.props.IntProperty(
+        name="Rows",
+        description="Number of rows shown on one page",
+        default=20,
+        min=1,
+        max=100
+    )
+
+    page: bpy.props.IntProperty(
+        name="Page",
+        min=0
+    )
+
+    jump_index: bpy.props.IntProperty(
+        name="Index",
+        description="Index of element to jump to",
+        min=0
+    )
+
+    search_value: bpy.props.FloatProperty(
+        name="Value",
+        description="Jumps to the first element with value, or length of vector, at least this "
+        "in the sorted order"
+    )
+
+
+def get_table_context(
+    context: bpy.types.Context
+) -> typing.Tuple[
+    AV_TableSettings,
+    typing.Optional[bpy.types.Object],
+    typing.Optional[bpy.types.Attribute]
+]:
+    settings = context.window_manager.attribute_viewer_table
+    obj = safe_get_active_object(context)
+    mesh = get_evaluated_mesh(obj, context.evaluated_depsgraph_get())
+    if mesh is None or settings.attribute == "":
+        return settings, obj, None
+
+    return settings, obj, mesh.attributes.get(settings.attribute)
+
+
+class AV_TablePage(bpy.types.Operator):
+    bl_idname = "attribute_viewer.table_page"
+    bl_label = "Change Page"
+    bl_description = "Moves the attribute table by pages"
+    bl_options = {'INTERNAL'}
+
+    delta: bpy.props.IntProperty(name="Delta", default=1)
+
+    def execute(self, context: bpy.types.Context):
+        settings, _, attribute = get_table_context(context)
+        if attribute is None:
+            return {'CANCELLED'}
+
+        last_page = max(len(attribute.data) - 1, 0) // settings.rows
+        settings.page = min(max(settings.page + self.delta, 0), last_page)
+        return {'FINISHED'}
+
+
+class AV_TableJump(bpy.types.Operator):
+    bl_idname = "attribute_viewer.table_jump"
+    bl_label = "Jump"
+    bl_description = "Shows page with the searched element"
+    bl_options = {'INTERNAL'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=(
+            ('INDEX', "Index", "Jump to element with the index"),
+            ('VALUE', "Value", "Jump to the first element reaching the value in the sorted order"),
+        )
+    )
+
+    def execute(self, context: bpy.types.Context):
+        settings, obj, attribute = get_table_context(context)
+        if attribute is None or len(attribute.data) == 0:
+            return {'CANCELLED'}
+
+        order, sorted_keys = get_table_order(obj, attribute, settings.sort)
+        if self.mode == 'INDEX':
+            if settings.jump_index >= len(order):
+                self.report({'WARNING'}, f"There are only {len(order)} elements")
+                return {'CANCELLED'}
+
+            position = int(np.flatnonzero(order == settings.jump_index)[0])
+        elif settings.sort == 'DESCENDING':
+            position = int(np.searchsorted(-sorted_keys, -settings.search_value, side='right')) - 1
+        else:
+            position = int(np.searchsorted(sorted_keys, settings.search_value, side='left'))
+
+        position = min(max(position, 0), len(order) - 1)
+        settings.page = position // settings.rows
+        return {'FINISHED'}
+
+
+class AV_TableSelectElement(GeoNodesEditorOnlyMixin, bpy.types.Operator):
+    bl_idname = "attribute_viewer.table_select_element"
+    bl_label = "Select Element"
+    bl_description = "Shows only this element in the attribute viewer"
+    bl_options = {'INTERNAL'}
+
+    index: bpy.props.IntProperty(name="Index", min=0)
+    domain: bpy.props.StringProperty(name="Domain", default='POINT')
+
+    def execute(self, context: bpy.types.Context):
+        node_tree = context.space_data.node_tree
+        viewer = find_target_viewer(node_tree)
+        if viewer is None:
+            self.report({'WARNING'}, "No attribute viewer in the active node tree")
+            return {'CANCELLED'}
+
+        helper = find_selection_helper(viewer, INDEX_SELECTION_HELPER)
+        if helper is None:
+            helper = insert_selection_helper(
+                node_tree, viewer, node_groups.INDEX_SELECTION, INDEX_SELECTION_HELPER)
+
+        helper.inputs["Index"].default_value = self.index
+        domain = get_viewer_domain_socket(viewer)
+        if self.domain in node_groups.DOMAINS and not domain.is_linked:
+            domain.default_value = node_groups.DOMAINS.index(self.domain)
+
+        return {'FINISHED'}
+
+
+class AV_TableClearSelection(GeoNodesEditorOnlyMixin, bpy.types.Operator):
+    bl_idname = "attribute_viewer.table_clear_selection"
+    bl_label = "Clear Element Selection"
+    bl_description = "Shows all elements in the attribute viewers again"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context: bpy.types.Context):
+        node_tree = context.space_data.node_tree
+        for node in list(node_tree.nodes):
+            if is_viewer_helper(node, INDEX_SELECTION_HELPER):
+                remove_viewer_helper(node_tree, node)
+
+        return {'FINISHED'}
+
+
+class AV_StoreViewedAttribute(GeoNodesEditorOnlyMixin, bpy.types.Operator):
+    bl_idname = "attribute_viewer.store_viewed_attribute"
+    bl_label = "Store Viewed Attribute"
+    bl_description = "Stores value viewed by the active viewer as " \
+        f"'{node_groups.VIEWED_ATTRIBUTE}' attribute, so it can be listed in the table"
+
+    def execute(self, context: bpy.types.Context):
+        node_tree = context.space_data.node_tree
+        viewer = find_target_viewer(node_tree)
+        output_geo_socket = get_group_output_geometry_socket(node_tree)
+        if viewer is None or output_geo_socket is None:
+            self.report({'WARNING'}, "Viewer and group output with geometry are required")
+            return {'CANCELLED'}
+
+        value_socket = viewer.inputs["Attribute"]
+        if not value_socket.is_linked:
+            self.report({'WARNING'}, "Viewer doesn't view any attribute")
+            return {'CANCELLED'}
+
+        value_socket = value_socket.links[0].from_socket
+        data_type = get_attribute_data_type(value_socket)
+        if data_type is None:
+            self.report({'WARNING'}, "Viewed attribute can't be stored")
+            return {'CANCELLED'}
+
+        store = None
+        if output_geo_socket.is_linked and \
+                is_viewer_helper(output_geo_socket.links[0].from_node, STORE_HELPER):
+            store = output_geo_socket.links[0].from_node
+        else:
+            store = node_tree.nodes.new('GeometryNodeStoreNamedAttribute')
+            store[VIEWER_HELPER_CUSTOM_PROP] = STORE_HELPER
+            store.label = "Store Viewed"
+            output_node = output_geo_socket.node
+            store.location = (output_node.location.x - 200, output_node.location.y - 200)
+            if output_geo_socket.is_linked:
+                node_tree.links.new(output_geo_socket.links[0].from_socket, store.inputs["Geometry"])
+            node_tree.links.new(store.outputs["Geometry"], output_geo_socket)
+
+        store.data_type = data_type
+        domain = get_viewer_domain_socket(viewer).default_value
+        store.domain = node_groups.DOMAINS[min(max(domain, 0), len(node_groups.DOMAINS) - 1)]
+        node_groups.find_socket(store.inputs, "Name").default_value = node_groups.VIEWED_ATTRIBUTE
+        node_tree.links.new(value_socket, node_groups.find_socket(store.inputs, "Value"))
+
+        try:
+            context.window_manager.attribute_viewer_table.attribute = node_groups.VIEWED_ATTRIBUTE
+        except TypeError:
+            # Attribute is listed only after the node tree is evaluated with it
+            pass
+
+        return {'FINISHED'}
+
+
+class AV_AttributeTablePanel(GeoNodesEditorOnlyMixin, bpy.types.Panel):
+    bl_idname = "NODE_PT_attribute_viewer_table"
+    bl_label = "Attribute Table"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "Attribute Viewer"
+
+    def draw(self, context: bpy.types.Context):
+        layout = self.layout
+        settings, obj, attribute = get_table_context(context)
+
+        row = layout.row(align=True)
+        row.prop(settings, "attribute", text="")
+        row.operator(AV_StoreViewedAttribute.bl_idname, text="", icon='IMPORT')
+        layout.prop(settings, "sort")
+
+        if attribute is None:
+            layout.label(text="No attribute on the evaluated active object", icon='INFO')
+            return
+
+        count = len(attribute.data)
+        last_page = max(count - 1, 0) // settings.rows
+        page = min(settings.page, last_page)
+        start = page * settings.rows
+        end = min(start + settings.rows, count)
+
+        row = layout.row(align=True)
+        row.operator(AV_TablePage.bl_idname, text="", icon='TRIA_LEFT').delta = -1
+        row.label(text=f"{start}-{max(end - 1, 0)} of {count}")
+        row.operator(AV_TablePage.bl_idname, text="", icon='TRIA_RIGHT').delta = 1
+        layout.prop(settings, "rows")
+
+        row = layout.row(align=True)
+        row.prop(settings, "jump_index")
+        row.operator(AV_TableJump.bl_idname, text="", icon='VIEWZOOM').mode = 'INDEX'
+        if settings.sort != 'INDEX':
+            row = layout.row(align=True)
+            row.prop(settings, "search_value")
+            row.operator(AV_TableJump.bl_idname, text="", icon='VIEWZOOM').mode = 'VALUE'
+
+        decimals = get_preferences().decimals
+        column = layout.column(align=True)
+        for index, value in read_table_rows(obj, attribute, settings.sort, start, end):
+            row = column.row(align=True)
+            split = row.split(factor=0.25, align=True)
+            split.label(text=str(index))
+            split.label(text=format_table_value(value, decimals))
+            op = row.operator(AV_TableSelectElement.bl_idname, text="", icon='RESTRICT_SELECT_OFF')
+            op.index = index
+            op.domain = attribute.domain
+
+        layout.operator(AV_TableClearSelection.bl_idname, icon='X')
+
+
+class AV_SetViewerGate(GeoNodesEditorOnlyMixin, bpy.types.Operator):
+    bl_idname = "attribute_viewer.set_viewer_gate"
+    bl_label = "Show Viewers On"
+    bl_description = "Sets what objects using the active node tree generate the attribute " \
+        "viewer labels"
+
+    users: bpy.props.EnumProperty(
+        name="Users",
+        items=(
+            ('ACTIVE', "Active Object", "Generate labels only on the active object"),
+            ('SELECTED', "Selected Objects", "Generate labels only on the selected objects"),
+            ('ALL', "All Objects", "Generate labels on all objects using the node tree"),
+        )
+    )
+
+    def execute(self, context: bpy.types.Context):
+        node_tree = context.space_data.node_tree
+        if self.users == 'ALL':
+            set_viewer_gate(node_tree, None)
+            return {'FINISHED'}
+
+        if len(get_node_tree_users(node_tree)) == 0:
+            self.report(
+                {'WARNING'},
+                "Viewers can be limited only in node tree used directly by geometry nodes modifiers"
+            )
+            return {'CANCELLED'}
+
+        if self.users == 'ACTIVE':
+            allowed = {safe_get_active_object(context)}
+        else:
+            allowed = set(context.selected_objects)
+
+        set_viewer_gate(node_tree, allowed)
+        return {'FINISHED'}
+
+
+class AV_QuickView(bpy.types.Operator):
     bl_idname = "attribute_viewer.quick_view"
-    # shown in context menu, alows easy view of UV_Map, VertexColor, ...
-    # when clicked geometry node group is going to be spawned on the mesh
-    # and connected with the correct attributes, ...
-    # Use cases:
-    # - vertex crease
-    # - vertex color
-    # - vertex position
+    bl_label = "Quick View Attribute"
+    bl_description = "Views stored attribute of the active object, such as vertex group, crease " \
+        "or color, from a separate object, so the node tree of the object isn't changed"
+    bl_property = "attribute"
+
+    attribute: bpy.props.EnumProperty(
+        name="Attribute",
+        items=lambda self, context: get_quick_view_enum_items(safe_get_active_object(context))
+    )
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        obj = get_quick_view_source(safe_get_active_object(context))
+        return obj is not None and obj.type == 'MESH'
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        context.window_manager.invoke_search_popup(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context: bpy.types.Context):
+        source = get_quick_view_source(safe_get_active_object(context))
+        if self.attribute == "":
+            self.report({'WARNING'}, f"'{source.name}' has no attribute to view")
+            return {'CANCELLED'}
+
+        ensure_viewer_nodes_loaded()
+        mesh = get_evaluated_mesh(source, context.evaluated_depsgraph_get())
+        attribute = mesh.attributes.get(self.attribute) if mesh is not None else None
+        if attribute is not None:
+            type_ = QUICK_VIEW_ATTRIBUTE_TYPES.get(attribute.data_type, 0)
+            domain = node_groups.DOMAINS.index(attribute.domain)
+        else:
+            # Vertex group
+            type_ = 0
+            domain = node_groups.DOMAINS.index('POINT')
+
+        quick_view = ensure_quick_view_object(context, source)
+        modifier = quick_view.modifiers[node_groups.QUICK_VIEW]
+        set_modifier_input(modifier, "Object", source)
+        set_modifier_input(modifier, "Attribute", self.attribute)
+        set_modifier_input(modifier, "Values Object", None)
+        set_modifier_input(modifier, "Type", type_)
+        set_modifier_input(modifier, "Domain", domain)
+        set_modifier_input(
+            modifier, "Scale", get_size_factor(source) * GLOBAL_SCALE_FACTOR * get_preferences().scale)
+        # Setting ID properties doesn't tag the object for update on its own
+        quick_view.update_tag()
+        return {'FINISHED'}
+
+
+class AV_RemoveQuickView(bpy.types.Operator):
+    bl_idname = "attribute_viewer.remove_quick_view"
+    bl_label = "Remove Quick View"
+    bl_description = "Removes quick view of the active object"
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        return get_quick_view_source(safe_get_active_object(context)) is not None
+
+    def execute(self, context: bpy.types.Context):
+        source = get_quick_view_source(safe_get_active_object(context))
+        quick_view = bpy.data.objects.get(QUICK_VIEW_OBJECT_PREFIX + source.name)
+        if quick_view is None:
+            return {'CANCELLED'}
+
+        mesh = quick_view.data
+        bpy.data.objects.remove(quick_view)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+        return {'FINISHED'}
+
+
+class AV_CaptureAttribute(bpy.types.Operator):
+    bl_idname = "attribute_viewer.capture_attribute"
+    bl_label = "Capture Attribute"
+    bl_description = "Steps through frames and stores values of attribute of the evaluated " \
+        "object into a cache file, which can be viewed later without evaluating the node tree"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*" + CACHE_FILE_EXTENSION, options={'HIDDEN'})
+
+    object_name: bpy.props.StringProperty(
+        name="Object",
+        description="Object to capture, the active one is used if empty"
+    )
+
+    attribute: bpy.props.StringProperty(
+        name="Attribute",
+        description="Attribute of the evaluated mesh to capture, the viewed value is stored as "
+        f"'{node_groups.VIEWED_ATTRIBUTE}' by 'Store Viewed Attribute'",
+        default=node_groups.VIEWED_ATTRIBUTE
+    )
+
+    frame_start: bpy.props.IntProperty(name="Start", default=1)
+    frame_end: bpy.props.IntProperty(name="End", default=250)
+    frame_step: bpy.props.IntProperty(name="Step", default=1, min=1)
+
+    compress: bpy.props.BoolProperty(
+        name="Compress",
+        description="Compress the captured frames, uncompressed frames are read faster",
+        default=True
+    )
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        if self.filepath == "":
+            obj = safe_get_active_object(context)
+            name = obj.name if obj is not None else "capture"
+            self.filepath = bpy.path.abspath(f"//{name}_{self.attribute}{CACHE_FILE_EXTENSION}")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context: bpy.types.Context):
+        if self.object_name != "":
+            obj = bpy.data.objects.get(self.object_name)
+        else:
+            obj = get_quick_view_source(safe_get_active_object(context))
+
+        if obj is None or self.filepath == "":
+            self.report({'ERROR'}, "Object to capture and file to capture into are required")
+            return {'CANCELLED'}
+
+        scene = context.scene
+        frame_current = scene.frame_current
+        captured = 0
+        try:
+            with attribute_cache.CacheWriter(
+                bpy.path.abspath(self.filepath), self.attribute, self.compress
+            ) as writer:
+                for frame in range(self.frame_start, self.frame_end + 1, self.frame_step):
+                    scene.frame_set(frame)
+                    mesh = get_evaluated_mesh(obj, context.evaluated_depsgraph_get())
+                    attribute = mesh.attributes.get(self.attribute) if mesh is not None else None
+                    if attribute is None or attribute.data_type not in ATTRIBUTE_VALUE_PROPS:
+                        continue
+
+                    writer.append(frame, read_attribute_values(attribute), attribute.domain)
+                    captured += 1
+        except OSError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        finally:
+            scene.frame_set(frame_current)
+
+        if captured == 0:
+            self.report({'WARNING'}, f"'{self.attribute}' wasn't found on '{obj.name}' in any frame")
+        else:
+            self.report({'INFO'}, f"Captured {captured} frames of '{self.attribute}'")
+
+        return {'FINISHED'}
+
+
+class AV_ViewCapturedFrame(bpy.types.Operator):
+    bl_idname = "attribute_viewer.view_captured_frame"
+    bl_label = "View Captured Frame"
+    bl_description = "Shows values of frame from cache file on the active object through quick view"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*" + CACHE_FILE_EXTENSION, options={'HIDDEN'})
+
+    frame: bpy.props.IntProperty(
+        name="Frame",
+        description="Captured frame to view"
+    )
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        return get_quick_view_source(safe_get_active_object(context)) is not None
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        self.frame = context.scene.frame_current
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context: bpy.types.Context):
+        source = get_quick_view_source(safe_get_active_object(context))
+        try:
+            reader = attribute_cache.CacheReader(bpy.path.abspath(self.filepath))
+            values = reader.read(self.frame)
+        except (OSError, attribute_cache.CacheError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        domain = reader.domain(self.frame)
+        if domain not in node_groups.DOMAINS:
+            self.report({'ERROR'}, f"Values on '{domain}' domain can't be viewed")
+            return {'CANCELLED'}
+
+        if values.shape[1] not in QUICK_VIEW_CAPTURED_TYPES:
+            self.report({'ERROR'}, f"Values with {values.shape[1]} components can't be viewed")
+            return {'CANCELLED'}
+
+        ensure_viewer_nodes_loaded()
+        captured_object = load_captured_values(source, values)
+        quick_view = ensure_quick_view_object(context, source)
+        modifier = quick_view.modifiers[node_groups.QUICK_VIEW]
+        set_modifier_input(modifier, "Object", source)
+        set_modifier_input(modifier, "Attribute", reader.attribute)
+        set_modifier_input(modifier, "Values Object", captured_object)
+        set_modifier_input(modifier, "Type", QUICK_VIEW_CAPTURED_TYPES[values.shape[1]])
+        set_modifier_input(modifier, "Domain", node_groups.DOMAINS.index(domain))
+        set_modifier_input(
+            modifier, "Scale", get_size_factor(source) * GLOBAL_SCALE_FACTOR * get_preferences().scale)
+        quick_view.update_tag()
+        return {'FINISHED'}
+
+
+def quick_view_menu_func(self, context: bpy.types.Context) -> None:
+    layout: bpy.types.UILayout = self.layout
+    layout.separator()
+    layout.operator_context = 'INVOKE_DEFAULT'
+    layout.operator(AV_QuickView.bl_idname, icon='HIDE_OFF')
+    layout.operator(AV_RemoveQuickView.bl_idname)
+    layout.operator(AV_ViewCapturedFrame.bl_idname)
 
 
 class AV_AttributeMenu(GeoNodesEditorOnlyMixin, bpy.types.Menu):
@@ -816,6 +2452,14 @@ class AV_MainMenu(GeoNodesEditorOnlyMixin, bpy.types.Menu):
         layout.operator_context = 'INVOKE_DEFAULT'
         layout.menu(AV_AttributeMenu.bl_idname, icon='ADD')
         layout.separator()
+        layout.operator_menu_enum(AV_SetDiffReference.bl_idname, "reference")
+        layout.operator_menu_enum(AV_SetViewerGate.bl_idname, "users")
+        layout.separator()
+        layout.operator(AV_QuickView.bl_idname, icon='HIDE_OFF')
+        layout.operator(AV_RemoveQuickView.bl_idname)
+        layout.operator(AV_CaptureAttribute.bl_idname)
+        layout.operator(AV_ViewCapturedFrame.bl_idname)
+        layout.separator()
         layout.operator(AV_RemoveAllViewers.bl_idname)
 
 
@@ -833,9 +2477,23 @@ CLASSES = [
     AV_AddViewer,
     AV_RemoveViewer,
     AV_RemoveAllViewers,
+    AV_SetDiffReference,
+    AV_TablePage,
+    AV_TableJump,
+    AV_TableSelectElement,
+    AV_TableClearSelection,
+    AV_StoreViewedAttribute,
+    AV_SetViewerGate,
+    AV_QuickView,
+    AV_RemoveQuickView,
+    AV_CaptureAttribute,
+    AV_ViewCapturedFrame,
     # Menu
     AV_AttributeMenu,
     AV_MainMenu,
+    # Panel
+    AV_TableSettings,
+    AV_AttributeTablePanel,
 ]
 
 REGISTERED_KEYMAPS = []
@@ -864,11 +2522,25 @@ def register():
 
     register_keymaps()
 
+    bpy.types.WindowManager.attribute_viewer_table = bpy.props.PointerProperty(type=AV_TableSettings)
     bpy.types.NODE_MT_add.append(add_viewer_menu_func)
+    bpy.types.VIEW3D_MT_object_context_menu.append(quick_view_menu_func)
+    bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post)
+    bpy.app.handlers.frame_change_pre.append(diff_frame_change_pre)
+    bpy.app.handlers.load_post.append(diff_load_post)
 
 
 def unregister():
+    bpy.app.handlers.load_post.remove(diff_load_post)
+    bpy.app.handlers.frame_change_pre.remove(diff_frame_change_pre)
+    bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
+    bpy.types.VIEW3D_MT_object_context_menu.remove(quick_view_menu_func)
     bpy.types.NODE_MT_add.remove(add_viewer_menu_func)
+    del bpy.types.WindowManager.attribute_viewer_table
+    ELEMENT_SPACING_CACHE.clear()
+    ATTRIBUTE_ITEMS_CACHE.clear()
+    QUICK_VIEW_ITEMS_CACHE.clear()
+    TABLE_ORDER_CACHE.clear()
 
     for cls in reversed(CLASSES):
         bpy.utils.unregister_class(cls)
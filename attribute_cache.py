@@ -0,0 +1,166 @@
+# Geonodes Attribute Viewer - on-disk cache of attribute values captured over frames
+# Author: Zdenek Dolezal
+# Licence: GPL 3.0
+
+# Cache is a single file with values of one attribute per frame. It doesn't depend on 'bpy', so
+# the captured values can be inspected outside of Blender as well.
+#
+# Layout:
+#   MAGIC
+#   chunk per frame - raw or zlib compressed bytes of values of shape (count, components)
+#   footer - UTF-8 JSON with the chunk index, see 'CacheWriter.close'
+#   length of the footer as little-endian uint64
+#   MAGIC
+#
+# Raw chunks are memory mapped when read, so random access to frames is cheap even for
+# large caches.
+
+import json
+import struct
+import typing
+import zlib
+import numpy as np
+
+MAGIC = b"AVCACHE1"
+FORMAT_VERSION = 1
+FOOTER_LENGTH_FORMAT = "<Q"
+# Keys every frame entry of the index has, see 'CacheWriter.append'
+ENTRY_KEYS = ("offset", "size", "compression", "dtype", "shape", "domain")
+# Compressed chunk is stored raw if the compression doesn't save at least this ratio
+MIN_COMPRESSION_RATIO = 0.9
+
+
+class CacheError(Exception):
+    pass
+
+
+class CacheWriter:
+    """Writes values of frames one by one, the index is written on 'close'"""
+
+    def __init__(self, path: str, attribute: str, compress: bool = True):
+        self.path = path
+        self.attribute = attribute
+        self.compress = compress
+        self.frames: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+
+    def append(self, frame: int, values: np.ndarray, domain: str) -> None:
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        values = np.ascontiguousarray(values)
+        data = values.tobytes()
+        compression = "none"
+        if self.compress:
+            compressed = zlib.compress(data)
+            if len(compressed) < len(data) * MIN_COMPRESSION_RATIO:
+                data = compressed
+                compression = "zlib"
+
+        self.frames[str(frame)] = {
+            "offset": self._file.tell(),
+            "size": len(data),
+            "compression": compression,
+            "dtype": values.dtype.str,
+            "shape": list(values.shape),
+            "domain": domain,
+        }
+        self._file.write(data)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+
+        footer = json.dumps({
+            "version": FORMAT_VERSION,
+            "attribute": self.attribute,
+            "frames": self.frames,
+        }).encode("utf-8")
+        self._file.write(footer)
+        self._file.write(struct.pack(FOOTER_LENGTH_FORMAT, len(footer)))
+        self._file.write(MAGIC)
+        self._file.close()
+
+    def __enter__(self) -> "CacheWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class CacheReader:
+    """Reads values of any captured frame using the index from the footer"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise CacheError(f"'{path}' isn't attribute viewer cache")
+
+            tail_size = struct.calcsize(FOOTER_LENGTH_FORMAT) + len(MAGIC)
+            file_size = file.seek(0, 2)
+            if file_size < len(MAGIC) + tail_size:
+                raise CacheError(f"'{path}' wasn't written completely")
+
+            file.seek(file_size - tail_size)
+            tail = file.read(tail_size)
+            if tail[-len(MAGIC):] != MAGIC:
+                raise CacheError(f"'{path}' wasn't written completely")
+
+            footer_length, = struct.unpack(FOOTER_LENGTH_FORMAT, tail[:-len(MAGIC)])
+            footer_start = file_size - tail_size - footer_length
+            if footer_start < len(MAGIC):
+                raise CacheError(f"'{path}' has corrupted index")
+
+            file.seek(footer_start)
+            footer_bytes = file.read(footer_length)
+
+        try:
+            footer = json.loads(footer_bytes.decode("utf-8"))
+            version = footer.get("version")
+            if version != FORMAT_VERSION:
+                raise CacheError(f"Unsupported cache version {version}")
+
+            self.attribute: str = footer["attribute"]
+            self.index: typing.Dict[int, typing.Dict[str, typing.Any]] = {
+                int(frame): entry for frame, entry in footer["frames"].items()
+            }
+            for frame, entry in self.index.items():
+                missing = [key for key in ENTRY_KEYS if key not in entry]
+                if len(missing) > 0:
+                    raise CacheError(f"Frame {frame} in '{path}' is missing {', '.join(missing)}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # json.JSONDecodeError and UnicodeDecodeError are subclasses of ValueError
+            raise CacheError(f"'{path}' has corrupted index: {e}") from e
+
+    @property
+    def frames(self) -> typing.List[int]:
+        return sorted(self.index)
+
+    def domain(self, frame: int) -> str:
+        return self.index[frame]["domain"]
+
+    def read(self, frame: int) -> np.ndarray:
+        """Returns values of 'frame' of shape (count, components), raw chunks are memory mapped"""
+        if frame not in self.index:
+            raise CacheError(f"Frame {frame} isn't captured in '{self.path}'")
+
+        entry = self.index[frame]
+        try:
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            if len(shape) != 2:
+                raise ValueError(f"expected shape (count, components), got {shape}")
+            if entry["compression"] == "none":
+                if entry["size"] == 0:
+                    return np.empty(shape, dtype=dtype)
+                return np.memmap(
+                    self.path, dtype=dtype, mode="r", offset=entry["offset"], shape=shape)
+
+            with open(self.path, "rb") as file:
+                file.seek(entry["offset"])
+                data = file.read(entry["size"])
+
+            return np.frombuffer(zlib.decompress(data), dtype=dtype).reshape(shape)
+        except (zlib.error, ValueError, TypeError) as e:
+            raise CacheError(f"Frame {frame} in '{self.path}' is corrupted: {e}") from e
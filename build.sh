@@ -7,7 +7,7 @@ rm -rf ${BUILDS_FOLDER}/attribute_viewer
 mkdir -p ${BUILDS_FOLDER}/attribute_viewer/data
 
 # copy addon source files, remove pycache
-cp __init__.py ${BUILDS_FOLDER}/attribute_viewer
+cp *.py ${BUILDS_FOLDER}/attribute_viewer
 cp data/attribute_viewer_nodes.blend ${BUILDS_FOLDER}/attribute_viewer/data
 
 # change version in bl_info to match one in this file
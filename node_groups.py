@@ -0,0 +1,1268 @@
+# Geonodes Attribute Viewer - node groups built from Python
+# Author: Zdenek Dolezal
+# Licence: GPL 3.0
+
+# Node groups in this module are not shipped in 'data/attribute_viewer_nodes.blend', they are
+# built from Python when first needed. Groups are local to the file, so they can be rebuilt in
+# place when a builder changes, see 'BUILDERS_VERSION'.
+
+import typing
+import bpy
+
+# Increment when any of the builders changes, groups built by older versions are rebuilt
+BUILDERS_VERSION = 7
+# Custom property storing the builders version on each built node group
+VERSION_CUSTOM_PROP = "AV_BuildersVersion"
+
+# Named attributes used to pass data between the built node groups
+VALUE_ATTRIBUTE = "av_value"
+INDEX_ATTRIBUTE = "av_index"
+# Values stored on the snapshot object sampled by diff viewers, see 'build_diff_viewer'
+REFERENCE_ATTRIBUTE = "av_reference"
+# Viewed values stored on the original geometry by diff viewers, so they can be snapshotted
+DIFF_VALUE_ATTRIBUTE = "av_diff_value"
+DIFF_MASK_ATTRIBUTE = "av_diff_mask"
+# Viewed attribute stored on the output geometry for the attribute table
+VIEWED_ATTRIBUTE = "av_viewed"
+# Values loaded from capture cache onto the points of 'Values Object' of quick view
+CAPTURED_ATTRIBUTE = "av_captured"
+# Color written onto the viewed geometry by heatmap viewer and read by 'HEATMAP_MATERIAL'
+HEATMAP_ATTRIBUTE = "av_heatmap"
+HEATMAP_MATERIAL = "AV_Heatmap"
+# (Position, color) of the heatmap color ramp elements
+HEATMAP_COLORS = (
+    (0.0, (0.05, 0.05, 0.6, 1.0)),
+    (0.5, (0.1, 0.8, 0.2, 1.0)),
+    (1.0, (0.9, 0.1, 0.05, 1.0)),
+)
+# Color of elements not selected by the heatmap viewer
+HEATMAP_UNSELECTED_COLOR = (0.2, 0.2, 0.2, 1.0)
+# Attribute read by 'AV_Material' to color the viewer geometry
+COLOR_ATTRIBUTE = "@color"
+# Material shipped with the viewer nodes, loaded together with them
+VIEWER_MATERIAL = "AV_Material"
+
+# Value of the 'Domain' input of viewers to the domain it represents
+DOMAINS = ('POINT', 'EDGE', 'FACE', 'CORNER', 'INSTANCE', 'CURVE')
+
+# (Component, 'Separate Components' output, domain, 'Domain' input value, 'Domain Size' output)
+DOMAIN_COMPONENTS = (
+    ('MESH', "Mesh", 'POINT', 0, "Point Count"),
+    ('MESH', "Mesh", 'EDGE', 1, "Edge Count"),
+    ('MESH', "Mesh", 'FACE', 2, "Face Count"),
+    ('MESH', "Mesh", 'CORNER', 3, "Face Corner Count"),
+    ('POINTCLOUD', "Point Cloud", 'POINT', 0, "Point Count"),
+    ('CURVE', "Curve", 'POINT', 0, "Point Count"),
+    ('CURVE', "Curve", 'CURVE', 5, "Spline Count"),
+    ('INSTANCES', "Instances", 'INSTANCE', 4, "Instance Count"),
+)
+
+# Socket type to the idname usable for new group interface socket
+SOCKET_TYPE_IDNAMES = {
+    'VALUE': 'NodeSocketFloat',
+    'INT': 'NodeSocketInt',
+    'BOOLEAN': 'NodeSocketBool',
+    'VECTOR': 'NodeSocketVector',
+    'RGBA': 'NodeSocketColor',
+    'STRING': 'NodeSocketString',
+    'OBJECT': 'NodeSocketObject',
+    'MATERIAL': 'NodeSocketMaterial',
+    'GEOMETRY': 'NodeSocketGeometry',
+}
+
+# Value of the 'Mode' input of 'AV_Filter' to what elements it selects
+FILTER_MODES = ('HIGHEST', 'LOWEST', 'OUTSIDE_RANGE', 'NON_FINITE')
+# Values with larger magnitude are considered infinite by 'AV_Filter'
+MAX_FINITE_FLOAT = 3.4e38
+
+# Value of the 'Statistic' input of grid viewer to what it shows for each cell
+GRID_STATISTICS = ('MEAN', 'MIN', 'MAX', 'COUNT')
+# Cell size of grid viewer relative to the text 'Scale' when not set explicitly
+GRID_CELL_SCALE_FACTOR = 5.0
+# Cells along each axis are limited, so the cell index is exactly representable by float
+GRID_MAX_CELLS = 255
+# Marks the point representing the whole grid cell in grid viewer
+GRID_FIRST_ATTRIBUTE = "av_grid_first"
+
+# Value viewer loaded from the blend, reused by viewers built here to generate the text
+FLOAT_VALUE_VIEWER = "AV_Float-Value"
+# Value of the 'Type' input of quick view to (named attribute data type, switch input type,
+# viewer loaded from blend)
+QUICK_VIEW_TYPES = (
+    ('FLOAT', 'FLOAT', FLOAT_VALUE_VIEWER),
+    ('FLOAT_VECTOR', 'VECTOR', "AV_Vector-Value"),
+    ('FLOAT_COLOR', 'RGBA', "AV_Color"),
+)
+
+# Sorting elements is available since 4.1, selecting and aggregating by order isn't possible before
+SORT_ELEMENTS_SUPPORTED = hasattr(bpy.types, "GeometryNodeSortElements")
+
+# 'Align Euler to Vector' is deprecated in favor of the rotation socket variant since 4.2
+ALIGN_TO_VECTOR_NODE = "FunctionNodeAlignRotationToVector" \
+    if hasattr(bpy.types, "FunctionNodeAlignRotationToVector") \
+    else "FunctionNodeAlignEulerToVector"
+
+# Domain to the 'Mesh to Points' mode creating one point per its element
+MESH_TO_POINTS_MODES = {
+    'POINT': 'VERTICES',
+    'EDGE': 'EDGES',
+    'FACE': 'FACES',
+    'CORNER': 'CORNERS',
+}
+
+SocketKey = typing.Union[int, str, typing.Tuple[str, ...]]
+
+
+def find_socket(
+    sockets: typing.Iterable[bpy.types.NodeSocket],
+    key: SocketKey
+) -> bpy.types.NodeSocket:
+    """Returns socket by index or the first enabled socket with given name
+
+    Nodes such as 'Switch' or 'Compare' have one socket per data type with the same name, only
+    the one matching the node data type is enabled. Tuple of names can be used for sockets that
+    were renamed between Blender versions.
+    """
+    if isinstance(key, int):
+        return sockets[key]
+
+    names = (key, ) if isinstance(key, str) else key
+    for name in names:
+        for socket in sockets:
+            if socket.name == name and socket.enabled:
+                return socket
+
+    raise KeyError(f"No enabled socket named '{key}'")
+
+
+def new_interface_socket(
+    node_group: bpy.types.NodeTree,
+    in_out: str,
+    socket_type: str,
+    name: str
+):
+    if bpy.app.version >= (4, 0, 0):
+        return node_group.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
+
+    sockets = node_group.inputs if in_out == 'INPUT' else node_group.outputs
+    return sockets.new(socket_type, name)
+
+
+def find_interface_input(
+    node_group: bpy.types.NodeTree,
+    name: str
+) -> typing.Optional[typing.Any]:
+    if bpy.app.version >= (4, 0, 0):
+        for item in node_group.interface.items_tree:
+            if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == name:
+                return item
+    else:
+        for socket in node_group.inputs:
+            if socket.name == name:
+                return socket
+
+    return None
+
+
+def get_input_identifier(node_group: bpy.types.NodeTree, name: str) -> str:
+    """Returns identifier of group input 'name', modifier inputs are keyed by it"""
+    socket = find_interface_input(node_group, name)
+    if socket is None:
+        raise KeyError(f"No input named '{name}' in '{node_group.name}'")
+
+    return socket.identifier
+
+
+def remove_interface_input(node_group: bpy.types.NodeTree, socket: typing.Any) -> None:
+    if bpy.app.version >= (4, 0, 0):
+        node_group.interface.remove(socket)
+    else:
+        node_group.inputs.remove(socket)
+
+
+def clear_node_group(node_group: bpy.types.NodeTree) -> None:
+    node_group.nodes.clear()
+    if bpy.app.version >= (4, 0, 0):
+        node_group.interface.clear()
+    else:
+        node_group.inputs.clear()
+        node_group.outputs.clear()
+
+
+class NodeGroupBuilder:
+    """Thin wrapper over node group API to keep the builders readable
+
+    All group inputs and outputs have to be added before first call to 'input' or 'output'.
+    """
+
+    def __init__(self, node_group: bpy.types.NodeTree):
+        self.node_group = node_group
+        self.input_names: typing.List[str] = []
+        self._group_input: typing.Optional[bpy.types.Node] = None
+        self._group_output: typing.Optional[bpy.types.Node] = None
+
+    def add_input(
+        self,
+        socket_type: str,
+        name: str,
+        default: typing.Any = None,
+        min_value: typing.Optional[float] = None,
+        max_value: typing.Optional[float] = None,
+        description: str = ""
+    ) -> None:
+        socket = new_interface_socket(self.node_group, 'INPUT', socket_type, name)
+        self.input_names.append(name)
+        if default is not None:
+            socket.default_value = default
+        if min_value is not None:
+            socket.min_value = min_value
+        if max_value is not None:
+            socket.max_value = max_value
+        socket.description = description
+
+    def add_inputs_from(
+        self,
+        node: bpy.types.Node,
+        skip: typing.Iterable[str] = ()
+    ) -> typing.List[str]:
+        """Adds inputs of 'node' not present on the group yet, returns names of added inputs"""
+        added = []
+        for socket in node.inputs:
+            if socket.name in self.input_names or socket.name in skip or not socket.enabled:
+                continue
+
+            default = getattr(socket, "default_value", None)
+            # Vector and color defaults are property arrays, which can't be assigned directly
+            if default is not None and not isinstance(default, (str, int, float, bpy.types.ID)):
+                default = tuple(default)
+            self.add_input(SOCKET_TYPE_IDNAMES[socket.type], socket.name, default)
+            added.append(socket.name)
+
+        return added
+
+    def add_output(self, socket_type: str, name: str) -> None:
+        new_interface_socket(self.node_group, 'OUTPUT', socket_type, name)
+
+    def input(self, name: str) -> bpy.types.NodeSocket:
+        if self._group_input is None:
+            self._group_input = self.node('NodeGroupInput')
+        return find_socket(self._group_input.outputs, name)
+
+    def output(self, name: str) -> bpy.types.NodeSocket:
+        if self._group_output is None:
+            self._group_output = self.node('NodeGroupOutput')
+        return find_socket(self._group_output.inputs, name)
+
+    def node(
+        self,
+        type_: str,
+        inputs: typing.Optional[typing.Dict[SocketKey, typing.Any]] = None,
+        **props
+    ) -> bpy.types.Node:
+        """Creates new node of 'type_', sets its 'props' and then its 'inputs'
+
+        Values of 'inputs' are either sockets to link from or default values to set.
+        """
+        nodes = self.node_group.nodes
+        node = nodes.new(type_)
+        # Stagger the nodes, so the group is at least somewhat readable when opened
+        node.location = (len(nodes) % 12 * 200, -(len(nodes) // 12) * 250)
+        for prop, value in props.items():
+            setattr(node, prop, value)
+
+        for key, value in (inputs or {}).items():
+            self.set_input(node, key, value)
+
+        return node
+
+    def set_input(self, node: bpy.types.Node, key: SocketKey, value: typing.Any) -> None:
+        socket = find_socket(node.inputs, key)
+        if isinstance(value, bpy.types.NodeSocket):
+            self.node_group.links.new(value, socket)
+        else:
+            socket.default_value = value
+
+    def link(self, from_socket: bpy.types.NodeSocket, to_socket: bpy.types.NodeSocket) -> None:
+        self.node_group.links.new(from_socket, to_socket)
+
+    @staticmethod
+    def out(node: bpy.types.Node, key: SocketKey = 0) -> bpy.types.NodeSocket:
+        return find_socket(node.outputs, key)
+
+    def switch(
+        self,
+        input_type: str,
+        switch: typing.Any,
+        false: typing.Any = None,
+        true: typing.Any = None
+    ) -> bpy.types.NodeSocket:
+        inputs = {"Switch": switch}
+        if false is not None:
+            inputs["False"] = false
+        if true is not None:
+            inputs["True"] = true
+        return self.out(self.node('GeometryNodeSwitch', inputs, input_type=input_type), "Output")
+
+    def boolean_math(self, operation: str, *values: typing.Any) -> bpy.types.NodeSocket:
+        node = self.node('FunctionNodeBooleanMath', operation=operation)
+        for i, value in enumerate(values):
+            self.set_input(node, i, value)
+        return self.out(node, "Boolean")
+
+    def math(self, operation: str, *values: typing.Any) -> bpy.types.NodeSocket:
+        node = self.node('ShaderNodeMath', operation=operation)
+        for i, value in enumerate(values):
+            self.set_input(node, i, value)
+        return self.out(node, "Value")
+
+    def compare(
+        self,
+        data_type: str,
+        operation: str,
+        a: typing.Any,
+        b: typing.Any
+    ) -> bpy.types.NodeSocket:
+        node = self.node(
+            'FunctionNodeCompare', {"A": a, "B": b}, data_type=data_type, operation=operation)
+        return self.out(node, "Result")
+
+    def named_attribute(self, data_type: str, name: str) -> bpy.types.NodeSocket:
+        node = self.node('GeometryNodeInputNamedAttribute', {"Name": name}, data_type=data_type)
+        return self.out(node, "Attribute")
+
+    def store_named_attribute(
+        self,
+        geometry: bpy.types.NodeSocket,
+        data_type: str,
+        domain: str,
+        name: str,
+        value: typing.Any,
+        selection: typing.Any = None
+    ) -> bpy.types.NodeSocket:
+        inputs = {"Geometry": geometry, "Name": name, "Value": value}
+        if selection is not None:
+            inputs["Selection"] = selection
+        node = self.node(
+            'GeometryNodeStoreNamedAttribute', inputs, data_type=data_type, domain=domain)
+        return self.out(node, "Geometry")
+
+    def join(self, *geometries: bpy.types.NodeSocket) -> bpy.types.NodeSocket:
+        node = self.node('GeometryNodeJoinGeometry')
+        for geometry in geometries:
+            self.link(geometry, node.inputs[0])
+        return self.out(node, "Geometry")
+
+    def domain_switch(
+        self,
+        input_type: str,
+        branches: typing.Sequence[bpy.types.NodeSocket]
+    ) -> bpy.types.NodeSocket:
+        """Switches between 'branches' by the 'Domain' input, one branch per value of 'DOMAINS'"""
+        result = branches[0]
+        for domain_value, branch in enumerate(branches[1:], start=1):
+            is_domain = self.compare('INT', 'EQUAL', self.input("Domain"), domain_value)
+            result = self.switch(input_type, is_domain, result, branch)
+
+        return result
+
+    def store_on_domain(
+        self,
+        geometry: bpy.types.NodeSocket,
+        data_type: str,
+        name: str,
+        value: typing.Any
+    ) -> bpy.types.NodeSocket:
+        return self.domain_switch('GEOMETRY', [
+            self.store_named_attribute(geometry, data_type, domain, name, value)
+            for domain in DOMAINS
+        ])
+
+    def viewer_output(self, viewer_geometry: bpy.types.NodeSocket) -> None:
+        """Links 'viewer_geometry' to the output respecting the common viewer inputs
+
+        Expects the 'Geometry', 'Viewport Only' and 'Show Original Geometry' inputs and
+        'Geometry' output to be present on the group.
+        """
+        is_viewport = self.out(self.node('GeometryNodeIsViewport'), "Is Viewport")
+        hide = self.boolean_math(
+            'AND',
+            self.input("Viewport Only"),
+            self.boolean_math('NOT', is_viewport)
+        )
+        shown = self.switch('GEOMETRY', hide, viewer_geometry)
+        joined = self.join(self.input("Geometry"), shown)
+        self.link(
+            self.switch('GEOMETRY', self.input("Show Original Geometry"), shown, joined),
+            self.output("Geometry")
+        )
+
+
+def add_domain_input(builder: NodeGroupBuilder) -> None:
+    builder.add_input(
+        'NodeSocketInt',
+        "Domain",
+        default=0,
+        min_value=0,
+        max_value=len(DOMAINS) - 1,
+        description="0 - Point, 1 - Edge, 2 - Face, 3 - Face Corner, 4 - Instance, 5 - Spline"
+    )
+
+
+def add_common_viewer_inputs(
+    builder: NodeGroupBuilder,
+    attribute_socket_type: str,
+    scale: float = 0.1
+) -> None:
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    add_domain_input(builder)
+    builder.add_input(attribute_socket_type, "Attribute")
+    builder.add_input('NodeSocketColor', "Color", default=(0.799103, 0.337164, 0.006995, 1.0))
+    builder.add_input('NodeSocketFloat', "Scale", default=scale, min_value=0.0)
+    builder.add_input('NodeSocketBool', "Viewport Only", default=True)
+    builder.add_input('NodeSocketBool', "Show Original Geometry", default=True)
+
+
+def build_domain_points(builder: NodeGroupBuilder) -> None:
+    """Creates one point per selected element of 'Domain' across all geometry components
+
+    The points store the 'Value' in 'VALUE_ATTRIBUTE' and the original element index in
+    'INDEX_ATTRIBUTE'. The selection is applied before any point is created, so unselected
+    elements cost only the attributes stored on them.
+    """
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    builder.add_input('NodeSocketInt', "Domain", default=0, min_value=0, max_value=len(DOMAINS) - 1)
+    builder.add_input('NodeSocketVector', "Value")
+    builder.add_output('NodeSocketGeometry', "Points")
+
+    components = builder.node('GeometryNodeSeparateComponents', {"Geometry": builder.input("Geometry")})
+    index = builder.out(builder.node('GeometryNodeInputIndex'), "Index")
+    position = builder.out(builder.node('GeometryNodeInputPosition'), "Position")
+    selection = builder.input("Selection")
+    points_per_domain = []
+    for component, component_output, domain, domain_value, size_output in DOMAIN_COMPONENTS:
+        # Other domains get empty geometry, so only the viewed domain is ever evaluated
+        geometry = builder.switch(
+            'GEOMETRY',
+            builder.compare('INT', 'EQUAL', builder.input("Domain"), domain_value),
+            None,
+            builder.out(components, component_output)
+        )
+        # Values are computed only for the selected elements
+        geometry = builder.store_named_attribute(
+            geometry, 'FLOAT_VECTOR', domain, VALUE_ATTRIBUTE, builder.input("Value"), selection)
+        geometry = builder.store_named_attribute(
+            geometry, 'INT', domain, INDEX_ATTRIBUTE, index, selection)
+
+        if component == 'MESH':
+            points = builder.node(
+                'GeometryNodeMeshToPoints',
+                {"Mesh": geometry, "Selection": selection},
+                mode=MESH_TO_POINTS_MODES[domain]
+            )
+            points_per_domain.append(builder.out(points, "Points"))
+        elif component == 'INSTANCES':
+            points = builder.node(
+                'GeometryNodeInstancesToPoints', {"Instances": geometry, "Selection": selection})
+            points_per_domain.append(builder.out(points, "Points"))
+        elif component == 'POINTCLOUD':
+            points = builder.node(
+                'GeometryNodeDeleteGeometry',
+                {"Geometry": geometry, "Selection": builder.boolean_math('NOT', selection)},
+                domain='POINT'
+            )
+            points_per_domain.append(builder.out(points, "Geometry"))
+        else:
+            # Curves have no conversion to control points with selection, so the unselected
+            # elements are deleted first and only the rest is sampled onto new points
+            selected = builder.out(
+                builder.node(
+                    'GeometryNodeDeleteGeometry',
+                    {"Geometry": geometry, "Selection": builder.boolean_math('NOT', selection)},
+                    domain=domain
+                ),
+                "Geometry"
+            )
+
+            def sample(data_type: str, value: bpy.types.NodeSocket) -> bpy.types.NodeSocket:
+                node = builder.node(
+                    'GeometryNodeSampleIndex',
+                    {"Geometry": selected, "Value": value, "Index": index},
+                    data_type=data_type,
+                    domain=domain
+                )
+                return builder.out(node, "Value")
+
+            size = builder.node(
+                'GeometryNodeAttributeDomainSize', {"Geometry": selected}, component=component)
+            points = builder.node(
+                'GeometryNodePoints',
+                {"Count": builder.out(size, size_output), "Position": sample('FLOAT_VECTOR', position)}
+            )
+            points = builder.store_named_attribute(
+                builder.out(points), 'FLOAT_VECTOR', 'POINT', VALUE_ATTRIBUTE,
+                sample('FLOAT_VECTOR', builder.named_attribute('FLOAT_VECTOR', VALUE_ATTRIBUTE))
+            )
+            points = builder.store_named_attribute(
+                points, 'INT', 'POINT', INDEX_ATTRIBUTE,
+                sample('INT', builder.named_attribute('INT', INDEX_ATTRIBUTE))
+            )
+            points_per_domain.append(points)
+
+    builder.link(builder.join(*points_per_domain), builder.output("Points"))
+
+
+def build_arrow(builder: NodeGroupBuilder) -> bpy.types.NodeSocket:
+    """Builds unit length arrow pointing along Z axis"""
+    shaft = builder.node(
+        'GeometryNodeMeshCylinder', {"Vertices": 8, "Radius": 0.02, "Depth": 0.8})
+    shaft = builder.node(
+        'GeometryNodeTransform',
+        {"Geometry": builder.out(shaft, "Mesh"), "Translation": (0.0, 0.0, 0.4)}
+    )
+    head = builder.node(
+        'GeometryNodeMeshCone',
+        {"Vertices": 8, "Radius Top": 0.0, "Radius Bottom": 0.06, "Depth": 0.2}
+    )
+    head = builder.node(
+        'GeometryNodeTransform',
+        {"Geometry": builder.out(head, "Mesh"), "Translation": (0.0, 0.0, 0.9)}
+    )
+    return builder.join(builder.out(shaft, "Geometry"), builder.out(head, "Geometry"))
+
+
+def build_vector_viewer(builder: NodeGroupBuilder) -> None:
+    """Vector viewer placing one shared arrow or line mesh as instances on the viewed domain"""
+    add_common_viewer_inputs(builder, 'NodeSocketVector')
+    builder.add_input(
+        'NodeSocketBool', "Line / Arrow", default=True, description="Show line or arrow for each vector")
+    builder.add_input(
+        'NodeSocketBool', "Override Scale", default=False,
+        description="Use 'Scale' as length of all vectors instead of their magnitude"
+    )
+    builder.add_input(
+        'NodeSocketFloat', "Threshold", default=0.0001, min_value=0.0,
+        description="Vectors with smaller magnitude are culled before any geometry is created"
+    )
+    builder.add_input(
+        'NodeSocketBool', "Realize Instances", default=False,
+        description="Realize the instanced vectors, only needed if further processing requires it"
+    )
+    builder.add_output('NodeSocketGeometry', "Geometry")
+
+    attribute = builder.input("Attribute")
+    magnitude = builder.node('ShaderNodeVectorMath', {0: attribute}, operation='LENGTH')
+    selection = builder.boolean_math(
+        'AND',
+        builder.input("Selection"),
+        builder.compare('FLOAT', 'GREATER_THAN', builder.out(magnitude, "Value"), builder.input("Threshold"))
+    )
+    points = builder.node(
+        'GeometryNodeGroup',
+        {
+            "Geometry": builder.input("Geometry"),
+            "Selection": selection,
+            "Domain": builder.input("Domain"),
+            "Value": attribute,
+        },
+        node_tree=ensure_node_group(DOMAIN_POINTS)
+    )
+
+    vector = builder.named_attribute('FLOAT_VECTOR', VALUE_ATTRIBUTE)
+    length = builder.node('ShaderNodeVectorMath', {0: vector}, operation='LENGTH')
+    scale = builder.input("Scale")
+    length = builder.switch(
+        'FLOAT',
+        builder.input("Override Scale"),
+        builder.math('MULTIPLY', builder.out(length, "Value"), scale),
+        scale
+    )
+    # Only the length is scaled by the vector, thickness of the arrows is the same for all
+    instance_scale = builder.node('ShaderNodeCombineXYZ', {"X": scale, "Y": scale, "Z": length})
+    rotation = builder.node(ALIGN_TO_VECTOR_NODE, {"Vector": vector}, axis='Z')
+
+    line = builder.node(
+        'GeometryNodeMeshLine', {"Count": 2, "Offset": (0.0, 0.0, 1.0)}, mode='OFFSET')
+    shape = builder.switch(
+        'GEOMETRY', builder.input("Line / Arrow"), builder.out(line, "Mesh"), build_arrow(builder))
+    shape = builder.store_named_attribute(
+        shape, 'FLOAT_COLOR', 'POINT', COLOR_ATTRIBUTE, builder.input("Color"))
+    material = bpy.data.materials.get(VIEWER_MATERIAL)
+    if material is not None:
+        shape = builder.out(
+            builder.node('GeometryNodeSetMaterial', {"Geometry": shape, "Material": material}),
+            "Geometry"
+        )
+
+    instances = builder.node(
+        'GeometryNodeInstanceOnPoints',
+        {
+            "Points": builder.out(points, "Points"),
+            "Instance": shape,
+            "Rotation": builder.out(rotation, "Rotation"),
+            "Scale": builder.out(instance_scale, "Vector"),
+        }
+    )
+    instances = builder.out(instances, "Instances")
+    realized = builder.node('GeometryNodeRealizeInstances', {"Geometry": instances})
+    builder.viewer_output(builder.switch(
+        'GEOMETRY',
+        builder.input("Realize Instances"),
+        instances,
+        builder.out(realized, "Geometry")
+    ))
+
+
+def build_diff_viewer(builder: NodeGroupBuilder) -> None:
+    """Labels only elements whose value differs from reference by more than 'Threshold'
+
+    Reference is sampled by index from 'REFERENCE_ATTRIBUTE' of 'Reference Object' points if
+    there are any, otherwise the 'Reference' input is used. Viewed values are stored on the
+    original geometry, so the addon can snapshot them into the reference object.
+    """
+    value_viewer = builder.node('GeometryNodeGroup', node_tree=get_library_node_group(FLOAT_VALUE_VIEWER))
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    add_domain_input(builder)
+    builder.add_input('NodeSocketFloat', "Attribute")
+    builder.add_input(
+        'NodeSocketFloat', "Reference",
+        description="Value to compare against when 'Reference Object' has no snapshot"
+    )
+    builder.add_input(
+        'NodeSocketObject', "Reference Object",
+        description="Snapshot of values to compare against, set by the 'Set Diff Reference' operator"
+    )
+    builder.add_input(
+        'NodeSocketFloat', "Threshold", default=0.001, min_value=0.0,
+        description="Only elements whose value changed by more than this are labelled"
+    )
+    builder.add_input(
+        'NodeSocketBool', "Show Difference", default=False,
+        description="Label the difference instead of the viewed value"
+    )
+    builder.add_input('NodeSocketBool', "Show Original Geometry", default=True)
+    passed_inputs = builder.add_inputs_from(value_viewer)
+    builder.add_output('NodeSocketGeometry', "Geometry")
+
+    reference_geometry = builder.out(
+        builder.node(
+            'GeometryNodeObjectInfo',
+            {"Object": builder.input("Reference Object")},
+            transform_space='ORIGINAL'
+        ),
+        "Geometry"
+    )
+    snapshot_size = builder.node(
+        'GeometryNodeAttributeDomainSize', {"Geometry": reference_geometry}, component='MESH')
+    snapshot = builder.node(
+        'GeometryNodeSampleIndex',
+        {
+            "Geometry": reference_geometry,
+            "Value": builder.named_attribute('FLOAT', REFERENCE_ATTRIBUTE),
+            "Index": builder.out(builder.node('GeometryNodeInputIndex'), "Index"),
+        },
+        data_type='FLOAT',
+        domain='POINT'
+    )
+    reference = builder.switch(
+        'FLOAT',
+        builder.compare('INT', 'GREATER_THAN', builder.out(snapshot_size, "Point Count"), 0),
+        builder.input("Reference"),
+        builder.out(snapshot, "Value")
+    )
+
+    attribute = builder.input("Attribute")
+    difference = builder.math('SUBTRACT', attribute, reference)
+    changed = builder.boolean_math(
+        'AND',
+        builder.input("Selection"),
+        builder.compare(
+            'FLOAT', 'GREATER_THAN', builder.math('ABSOLUTE', difference), builder.input("Threshold"))
+    )
+    for name, value in (
+        ("Geometry", builder.input("Geometry")),
+        ("Selection", changed),
+        ("Domain", builder.input("Domain")),
+        ("Attribute", builder.switch('FLOAT', builder.input("Show Difference"), attribute, difference)),
+        ("Show Original Geometry", False),
+    ):
+        builder.set_input(value_viewer, name, value)
+    for name in passed_inputs:
+        builder.set_input(value_viewer, name, builder.input(name))
+
+    labels = builder.out(value_viewer, "Geometry")
+    stored = builder.store_on_domain(
+        builder.input("Geometry"), 'FLOAT', DIFF_VALUE_ATTRIBUTE, attribute)
+    stored = builder.store_on_domain(stored, 'BOOLEAN', DIFF_MASK_ATTRIBUTE, True)
+    builder.link(
+        builder.switch(
+            'GEOMETRY', builder.input("Show Original Geometry"), labels, builder.join(stored, labels)),
+        builder.output("Geometry")
+    )
+
+
+def select_top_elements(
+    builder: NodeGroupBuilder,
+    attribute: bpy.types.NodeSocket,
+    index: bpy.types.NodeSocket
+) -> bpy.types.NodeSocket:
+    """Selects the highest or lowest 'Count' elements by 'Mode' of 'AV_Filter', needs 4.1+
+
+    Elements are looked up by their index stored in float position, which is exact only up to
+    2^24 (about 16.7 million) elements. Above that, neighbouring indices round to the same
+    position and some of the top elements may be left out of the selection.
+    """
+    points = builder.node(
+        'GeometryNodeGroup',
+        {
+            "Geometry": builder.input("Geometry"),
+            "Selection": builder.input("Selection"),
+            "Domain": builder.input("Domain"),
+            "Value": attribute,
+        },
+        node_tree=ensure_node_group(DOMAIN_POINTS)
+    )
+    points = builder.out(points, "Points")
+    value = builder.named_attribute('FLOAT', VALUE_ATTRIBUTE)
+    sort_key = builder.switch(
+        'FLOAT',
+        builder.compare('INT', 'EQUAL', builder.input("Mode"), FILTER_MODES.index('LOWEST')),
+        builder.math('MULTIPLY', value, -1.0),
+        value
+    )
+    points = builder.out(
+        builder.node(
+            'GeometryNodeSortElements', {"Geometry": points, "Sort Key": sort_key}, domain='POINT'),
+        "Geometry"
+    )
+
+    top = builder.node(
+        'GeometryNodeDeleteGeometry',
+        {
+            "Geometry": points,
+            "Selection": builder.compare('INT', 'GREATER_EQUAL', index, builder.input("Count")),
+        },
+        domain='POINT'
+    )
+    # Move the points to X equal to the element index, so they can be found by nearest sampling,
+    # indices above 2^24 aren't exact in float, see the docstring
+    original_index = builder.named_attribute('INT', INDEX_ATTRIBUTE)
+    top = builder.node(
+        'GeometryNodeSetPosition',
+        {
+            "Geometry": builder.out(top, "Geometry"),
+            "Position": builder.out(builder.node('ShaderNodeCombineXYZ', {"X": original_index}), "Vector"),
+        }
+    )
+    top = builder.out(top, "Geometry")
+    nearest = builder.node(
+        'GeometryNodeSampleNearest',
+        {
+            "Geometry": top,
+            "Sample Position": builder.out(builder.node('ShaderNodeCombineXYZ', {"X": index}), "Vector"),
+        },
+        domain='POINT'
+    )
+    nearest_index = builder.node(
+        'GeometryNodeSampleIndex',
+        {"Geometry": top, "Value": original_index, "Index": builder.out(nearest, "Index")},
+        data_type='INT',
+        domain='POINT'
+    )
+    top_count = builder.node(
+        'GeometryNodeAttributeDomainSize', {"Geometry": top}, component='POINTCLOUD')
+    return builder.boolean_math(
+        'AND',
+        builder.compare('INT', 'GREATER_THAN', builder.out(top_count, "Point Count"), 0),
+        builder.compare('INT', 'EQUAL', builder.out(nearest_index, "Value"), index)
+    )
+
+
+def build_filter(builder: NodeGroupBuilder) -> None:
+    """Selects only the extreme elements of 'Attribute', to be connected to viewer 'Selection'
+
+    Modes are defined by 'FILTER_MODES'. Top 'Count' elements are found by sorting the points
+    created from the domain and looked up back by their index through nearest point sampling,
+    which is exact only for domains of up to 2^24 elements, see 'select_top_elements'.
+    Without sorting (before 4.1) the highest and lowest modes select nothing. 'Domain' is
+    passed through to the viewer, so both always use the same domain.
+    """
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    add_domain_input(builder)
+    builder.add_input('NodeSocketFloat', "Attribute")
+    builder.add_input(
+        'NodeSocketInt', "Mode", default=0, min_value=0, max_value=len(FILTER_MODES) - 1,
+        description="0 - Highest, 1 - Lowest, 2 - Outside Range, 3 - Non-Finite"
+    )
+    builder.add_input(
+        'NodeSocketInt', "Count", default=10, min_value=0,
+        description="How many highest or lowest values to select. Domains with more than "
+        "16.7 million (2^24) elements may get fewer of them selected"
+    )
+    builder.add_input('NodeSocketFloat', "Min", default=0.0)
+    builder.add_input('NodeSocketFloat', "Max", default=1.0)
+    builder.add_output('NodeSocketBool', "Selection")
+    builder.add_output('NodeSocketInt', "Domain")
+
+    builder.link(builder.input("Domain"), builder.output("Domain"))
+    attribute = builder.input("Attribute")
+    index = builder.out(builder.node('GeometryNodeInputIndex'), "Index")
+
+    # Without sorting only the first elements could be selected, which would be mistaken for
+    # the top ones, so none are selected instead
+    is_top = False
+    if SORT_ELEMENTS_SUPPORTED:
+        is_top = select_top_elements(builder, attribute, index)
+
+    outside_range = builder.boolean_math(
+        'OR',
+        builder.compare('FLOAT', 'LESS_THAN', attribute, builder.input("Min")),
+        builder.compare('FLOAT', 'GREATER_THAN', attribute, builder.input("Max"))
+    )
+    # Neither NaN nor infinity is equal to itself, as the difference is NaN
+    non_finite = builder.boolean_math(
+        'OR',
+        builder.boolean_math('NOT', builder.compare('FLOAT', 'EQUAL', attribute, attribute)),
+        builder.compare(
+            'FLOAT', 'GREATER_EQUAL', builder.math('ABSOLUTE', attribute), MAX_FINITE_FLOAT)
+    )
+
+    selected = is_top
+    for mode, mode_selection in (('OUTSIDE_RANGE', outside_range), ('NON_FINITE', non_finite)):
+        is_mode = builder.compare('INT', 'EQUAL', builder.input("Mode"), FILTER_MODES.index(mode))
+        selected = builder.switch('BOOLEAN', is_mode, selected, mode_selection)
+
+    builder.link(
+        builder.boolean_math('AND', builder.input("Selection"), selected),
+        builder.output("Selection")
+    )
+
+
+def ensure_heatmap_material() -> bpy.types.Material:
+    material = bpy.data.materials.get(HEATMAP_MATERIAL)
+    if material is not None and material.library is None:
+        return material
+
+    material = bpy.data.materials.new(HEATMAP_MATERIAL)
+    material.use_nodes = True
+    node_tree = material.node_tree
+    node_tree.nodes.clear()
+    attribute = node_tree.nodes.new('ShaderNodeAttribute')
+    attribute.attribute_name = HEATMAP_ATTRIBUTE
+    # Emission, so the values can be read regardless of the scene lighting
+    emission = node_tree.nodes.new('ShaderNodeEmission')
+    emission.location = (200, 0)
+    output = node_tree.nodes.new('ShaderNodeOutputMaterial')
+    output.location = (400, 0)
+    node_tree.links.new(attribute.outputs["Color"], emission.inputs["Color"])
+    node_tree.links.new(emission.outputs["Emission"], output.inputs["Surface"])
+    return material
+
+
+def build_heatmap_viewer(builder: NodeGroupBuilder) -> None:
+    """Colors the viewed geometry by normalized 'Attribute' instead of generating any text
+
+    Output replaces the viewed geometry rather than being joined to it.
+    """
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    add_domain_input(builder)
+    builder.add_input('NodeSocketFloat', "Attribute")
+    builder.add_input(
+        'NodeSocketBool', "Auto Range", default=True,
+        description="Use minimum and maximum of the selected values as the color range"
+    )
+    builder.add_input('NodeSocketFloat', "Min", default=0.0)
+    builder.add_input('NodeSocketFloat', "Max", default=1.0)
+    builder.add_input('NodeSocketBool', "Viewport Only", default=True)
+    builder.add_input(
+        'NodeSocketBool', "Enabled", default=True,
+        description="Output the geometry unchanged when disabled"
+    )
+    builder.add_output('NodeSocketGeometry', "Geometry")
+
+    geometry = builder.input("Geometry")
+    selection = builder.input("Selection")
+    attribute = builder.input("Attribute")
+    statistics = [
+        builder.node(
+            'GeometryNodeAttributeStatistic',
+            {"Geometry": geometry, "Selection": selection, "Attribute": attribute},
+            data_type='FLOAT',
+            domain=domain
+        )
+        for domain in DOMAINS
+    ]
+    auto_range = builder.input("Auto Range")
+    range_min = builder.switch(
+        'FLOAT', auto_range, builder.input("Min"),
+        builder.domain_switch('FLOAT', [builder.out(n, "Min") for n in statistics])
+    )
+    range_max = builder.switch(
+        'FLOAT', auto_range, builder.input("Max"),
+        builder.domain_switch('FLOAT', [builder.out(n, "Max") for n in statistics])
+    )
+    normalized = builder.node(
+        'ShaderNodeMapRange',
+        {"Value": attribute, "From Min": range_min, "From Max": range_max},
+        data_type='FLOAT',
+        clamp=True
+    )
+    ramp = builder.node('ShaderNodeValToRGB', {"Fac": builder.out(normalized, "Result")})
+    elements = ramp.color_ramp.elements
+    for i, (position, color) in enumerate(HEATMAP_COLORS):
+        element = elements[i] if i < len(elements) else elements.new(position)
+        element.position = position
+        element.color = color
+
+    color = builder.switch(
+        'RGBA', selection, HEATMAP_UNSELECTED_COLOR, builder.out(ramp, "Color"))
+    colored = builder.store_on_domain(geometry, 'FLOAT_COLOR', HEATMAP_ATTRIBUTE, color)
+    colored = builder.node(
+        'GeometryNodeSetMaterial', {"Geometry": colored, "Material": ensure_heatmap_material()})
+
+    is_viewport = builder.out(builder.node('GeometryNodeIsViewport'), "Is Viewport")
+    hide = builder.boolean_math(
+        'AND', builder.input("Viewport Only"), builder.boolean_math('NOT', is_viewport))
+    hide = builder.boolean_math('OR', hide, builder.boolean_math('NOT', builder.input("Enabled")))
+    builder.link(
+        builder.switch('GEOMETRY', hide, builder.out(colored, "Geometry"), geometry),
+        builder.output("Geometry")
+    )
+
+
+def build_grid_viewer(builder: NodeGroupBuilder) -> None:
+    """Bins elements into a grid and labels each occupied cell by statistic of its values
+
+    Number of labels is bounded by the number of cells, not by the number of elements.
+    """
+    value_viewer = builder.node('GeometryNodeGroup', node_tree=get_library_node_group(FLOAT_VALUE_VIEWER))
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    add_domain_input(builder)
+    builder.add_input('NodeSocketFloat', "Attribute")
+    builder.add_input(
+        'NodeSocketFloat', "Cell Size", default=0.0, min_value=0.0,
+        description="Size of the grid cells, derived from 'Scale' of the text if zero"
+    )
+    builder.add_input(
+        'NodeSocketInt', "Statistic", default=0, min_value=0, max_value=len(GRID_STATISTICS) - 1,
+        description="0 - Mean, 1 - Min, 2 - Max, 3 - Count. Min and max need Blender 4.1+, "
+        "nothing is shown for them on older versions"
+    )
+    builder.add_input('NodeSocketBool', "Show Original Geometry", default=True)
+    passed_inputs = builder.add_inputs_from(value_viewer)
+    builder.add_output('NodeSocketGeometry', "Geometry")
+
+    points = builder.node(
+        'GeometryNodeGroup',
+        {
+            "Geometry": builder.input("Geometry"),
+            "Selection": builder.input("Selection"),
+            "Domain": builder.input("Domain"),
+            "Value": builder.input("Attribute"),
+        },
+        node_tree=ensure_node_group(DOMAIN_POINTS)
+    )
+    points = builder.out(points, "Points")
+
+    cell_size = builder.switch(
+        'FLOAT',
+        builder.compare('FLOAT', 'GREATER_THAN', builder.input("Cell Size"), 0.0),
+        builder.math('MULTIPLY', builder.input("Scale"), GRID_CELL_SCALE_FACTOR),
+        builder.input("Cell Size")
+    )
+    bounds = builder.node('GeometryNodeBoundBox', {"Geometry": points})
+    extent = builder.node(
+        'ShaderNodeVectorMath',
+        {0: builder.out(bounds, "Max"), 1: builder.out(bounds, "Min")},
+        operation='SUBTRACT'
+    )
+    extent = builder.node('ShaderNodeSeparateXYZ', {"Vector": builder.out(extent, "Vector")})
+    max_extent = builder.math(
+        'MAXIMUM',
+        builder.math('MAXIMUM', builder.out(extent, "X"), builder.out(extent, "Y")),
+        builder.out(extent, "Z")
+    )
+    cell_size = builder.math(
+        'MAXIMUM', cell_size, builder.math('DIVIDE', max_extent, GRID_MAX_CELLS))
+
+    position = builder.out(builder.node('GeometryNodeInputPosition'), "Position")
+    cell = builder.node(
+        'ShaderNodeVectorMath', {0: position, 1: builder.out(bounds, "Min")}, operation='SUBTRACT')
+    cell = builder.node(
+        'ShaderNodeVectorMath',
+        {0: builder.out(cell, "Vector"), "Scale": builder.math('DIVIDE', 1.0, cell_size)},
+        operation='SCALE'
+    )
+    cell = builder.node('ShaderNodeVectorMath', {0: builder.out(cell, "Vector")}, operation='FLOOR')
+    cell_id = builder.node(
+        'ShaderNodeVectorMath',
+        {0: builder.out(cell, "Vector"), 1: (1.0, GRID_MAX_CELLS + 1, (GRID_MAX_CELLS + 1) ** 2)},
+        operation='DOT_PRODUCT'
+    )
+    cell_id = builder.out(cell_id, "Value")
+
+    def accumulate(data_type: str, value: typing.Any) -> bpy.types.Node:
+        return builder.node(
+            'GeometryNodeAccumulateField',
+            {"Value": value, ("Group ID", "Group Index"): cell_id},
+            data_type=data_type,
+            domain='POINT'
+        )
+
+    value = builder.named_attribute('FLOAT', VALUE_ATTRIBUTE)
+    if SORT_ELEMENTS_SUPPORTED:
+        points = builder.out(
+            builder.node(
+                'GeometryNodeSortElements',
+                {"Geometry": points, "Group ID": cell_id, "Sort Key": value},
+                domain='POINT'
+            ),
+            "Geometry"
+        )
+
+    counter = accumulate('FLOAT', 1.0)
+    count = builder.out(counter, "Total")
+    is_first = builder.compare('FLOAT', 'EQUAL', builder.out(counter, "Trailing"), 0.0)
+    mean = builder.math('DIVIDE', builder.out(accumulate('FLOAT', value), "Total"), count)
+    # Min and max need sorting, without it no cell is labelled rather than mislabelling
+    # other statistic as them, see 'shown' below
+    statistics = {'MEAN': mean, 'MIN': mean, 'MAX': mean, 'COUNT': count}
+    if SORT_ELEMENTS_SUPPORTED:
+        # Values are sorted within the cells, spread the first and the last one to whole cell
+        is_last = builder.compare('FLOAT', 'EQUAL', builder.out(counter, "Leading"), count)
+        statistics['MIN'] = builder.out(
+            accumulate('FLOAT', builder.switch('FLOAT', is_first, 0.0, value)), "Total")
+        statistics['MAX'] = builder.out(
+            accumulate('FLOAT', builder.switch('FLOAT', is_last, 0.0, value)), "Total")
+
+    statistic = statistics[GRID_STATISTICS[0]]
+    for statistic_value, name in enumerate(GRID_STATISTICS[1:], start=1):
+        statistic = builder.switch(
+            'FLOAT',
+            builder.compare('INT', 'EQUAL', builder.input("Statistic"), statistic_value),
+            statistic,
+            statistics[name]
+        )
+
+    points = builder.store_named_attribute(points, 'FLOAT', 'POINT', VALUE_ATTRIBUTE, statistic)
+    points = builder.store_named_attribute(points, 'BOOLEAN', 'POINT', GRID_FIRST_ATTRIBUTE, is_first)
+    mean_position = builder.node(
+        'ShaderNodeVectorMath',
+        {
+            0: builder.out(accumulate('FLOAT_VECTOR', position), "Total"),
+            "Scale": builder.math('DIVIDE', 1.0, count),
+        },
+        operation='SCALE'
+    )
+    points = builder.node(
+        'GeometryNodeSetPosition',
+        {"Geometry": points, "Position": builder.out(mean_position, "Vector")}
+    )
+    shown = builder.named_attribute('BOOLEAN', GRID_FIRST_ATTRIBUTE)
+    if not SORT_ELEMENTS_SUPPORTED:
+        for name in ('MIN', 'MAX'):
+            is_statistic = builder.compare(
+                'INT', 'EQUAL', builder.input("Statistic"), GRID_STATISTICS.index(name))
+            shown = builder.boolean_math('AND', shown, builder.boolean_math('NOT', is_statistic))
+    cells = builder.node(
+        'GeometryNodeDeleteGeometry',
+        {
+            "Geometry": builder.out(points, "Geometry"),
+            "Selection": builder.boolean_math('NOT', shown),
+        },
+        domain='POINT'
+    )
+
+    for name, input_value in (
+        ("Geometry", builder.out(cells, "Geometry")),
+        ("Domain", 0),
+        ("Attribute", builder.named_attribute('FLOAT', VALUE_ATTRIBUTE)),
+        ("Show Original Geometry", False),
+    ):
+        builder.set_input(value_viewer, name, input_value)
+    for name in passed_inputs:
+        builder.set_input(value_viewer, name, builder.input(name))
+
+    labels = builder.out(value_viewer, "Geometry")
+    builder.link(
+        builder.switch(
+            'GEOMETRY',
+            builder.input("Show Original Geometry"),
+            labels,
+            builder.join(builder.input("Geometry"), labels)
+        ),
+        builder.output("Geometry")
+    )
+
+
+def build_index_selection(builder: NodeGroupBuilder) -> None:
+    """Selects single element by its index, to be connected to viewer 'Selection'"""
+    builder.add_input('NodeSocketBool', "Selection", default=True)
+    builder.add_input('NodeSocketInt', "Index", default=0, min_value=0)
+    builder.add_output('NodeSocketBool', "Selection")
+
+    index = builder.out(builder.node('GeometryNodeInputIndex'), "Index")
+    builder.link(
+        builder.boolean_math(
+            'AND',
+            builder.input("Selection"),
+            builder.compare('INT', 'EQUAL', index, builder.input("Index"))
+        ),
+        builder.output("Selection")
+    )
+
+
+def build_gate(builder: NodeGroupBuilder) -> None:
+    """Passes the viewed geometry only if 'Enabled', connected before viewer 'Geometry'
+
+    Disabled viewer gets empty geometry, so it doesn't evaluate any of its nodes.
+    """
+    builder.add_input('NodeSocketGeometry', "Geometry")
+    builder.add_input('NodeSocketBool', "Enabled", default=False)
+    builder.add_output('NodeSocketGeometry', "Geometry")
+
+    builder.link(
+        builder.switch('GEOMETRY', builder.input("Enabled"), None, builder.input("Geometry")),
+        builder.output("Geometry")
+    )
+
+
+def build_quick_view(builder: NodeGroupBuilder) -> None:
+    """Views stored attribute of 'Object' from a separate object, outside of its node tree
+
+    The viewer used is picked by 'Type', one per 'QUICK_VIEW_TYPES'. When 'Values Object' has
+    any points, the values are sampled from its 'CAPTURED_ATTRIBUTE' by index instead.
+    """
+    builder.add_input('NodeSocketObject', "Object")
+    builder.add_input('NodeSocketString', "Attribute")
+    builder.add_input('NodeSocketObject', "Values Object")
+    builder.add_input(
+        'NodeSocketInt', "Type", default=0, min_value=0, max_value=len(QUICK_VIEW_TYPES) - 1,
+        description="0 - Float, 1 - Vector, 2 - Color"
+    )
+    viewers = [
+        builder.node('GeometryNodeGroup', node_tree=get_library_node_group(viewer_name))
+        for _, _, viewer_name in QUICK_VIEW_TYPES
+    ]
+    skip = ("Geometry", "Selection", "Attribute", "Show Original Geometry")
+    passed_inputs = []
+    for viewer in viewers:
+        passed_inputs.extend(builder.add_inputs_from(viewer, skip))
+    builder.add_output('NodeSocketGeometry', "Geometry")
+
+    # The quick view object copies transforms of the viewed one, so its geometry is kept local
+    geometry = builder.out(
+        builder.node(
+            'GeometryNodeObjectInfo', {"Object": builder.input("Object")}, transform_space='ORIGINAL'),
+        "Geometry"
+    )
+    values_geometry = builder.out(
+        builder.node('GeometryNodeObjectInfo', {"Object": builder.input("Values Object")}),
+        "Geometry"
+    )
+    values_size = builder.node(
+        'GeometryNodeAttributeDomainSize', {"Geometry": values_geometry}, component='MESH')
+    use_captured = builder.compare(
+        'INT', 'GREATER_THAN', builder.out(values_size, "Point Count"), 0)
+    index = builder.out(builder.node('GeometryNodeInputIndex'), "Index")
+    result = None
+    for type_value, (type_, viewer) in enumerate(zip(QUICK_VIEW_TYPES, viewers)):
+        data_type, input_type, _ = type_
+        captured = builder.node(
+            'GeometryNodeSampleIndex',
+            {
+                "Geometry": values_geometry,
+                "Value": builder.named_attribute(data_type, CAPTURED_ATTRIBUTE),
+                "Index": index,
+            },
+            data_type=data_type,
+            domain='POINT'
+        )
+        attribute = builder.switch(
+            input_type,
+            use_captured,
+            builder.named_attribute(data_type, builder.input("Attribute")),
+            builder.out(captured, "Value")
+        )
+        builder.set_input(viewer, "Geometry", geometry)
+        builder.set_input(viewer, "Attribute", attribute)
+        builder.set_input(viewer, "Show Original Geometry", False)
+        viewer_input_names = {socket.name for socket in viewer.inputs if socket.enabled}
+        for name in passed_inputs:
+            if name in viewer_input_names:
+                builder.set_input(viewer, name, builder.input(name))
+
+        labels = builder.out(viewer, "Geometry")
+        if result is None:
+            result = labels
+        else:
+            is_type = builder.compare('INT', 'EQUAL', builder.input("Type"), type_value)
+            result = builder.switch('GEOMETRY', is_type, result, labels)
+
+    builder.link(result, builder.output("Geometry"))
+
+
+DOMAIN_POINTS = "AV_Domain-Points"
+INDEX_SELECTION = "AV_Index-Selection"
+DIFF_VIEWER = "AV_Diff"
+GRID_VIEWER = "AV_Grid-Value"
+HEATMAP_VIEWER = "AV_Heatmap"
+FILTER = "AV_Filter"
+QUICK_VIEW = "AV_QuickView"
+GATE = "AV_Gate"
+
+# Name of the built node group to the function building it
+BUILDERS: typing.Dict[str, typing.Callable[[NodeGroupBuilder], None]] = {
+    DOMAIN_POINTS: build_domain_points,
+    "AV_Vector": build_vector_viewer,
+    DIFF_VIEWER: build_diff_viewer,
+    FILTER: build_filter,
+    HEATMAP_VIEWER: build_heatmap_viewer,
+    GRID_VIEWER: build_grid_viewer,
+    INDEX_SELECTION: build_index_selection,
+    QUICK_VIEW: build_quick_view,
+    GATE: build_gate,
+}
+
+
+def get_library_node_group(name: str) -> bpy.types.NodeTree:
+    node_group = bpy.data.node_groups.get(name)
+    if node_group is None:
+        raise RuntimeError(f"Node group '{name}' has to be loaded before building groups using it")
+
+    return node_group
+
+
+def find_local_node_group(name: str) -> typing.Optional[bpy.types.NodeTree]:
+    # Files saved with older versions can contain linked group of the same name
+    for node_group in bpy.data.node_groups:
+        if node_group.name == name and node_group.library is None:
+            return node_group
+
+    return None
+
+
+def ensure_node_group(name: str) -> bpy.types.NodeTree:
+    """Returns node group built by builder of 'name', builds or rebuilds it if necessary"""
+    node_group = find_local_node_group(name)
+    if node_group is None:
+        node_group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    elif node_group.get(VERSION_CUSTOM_PROP, None) == BUILDERS_VERSION:
+        return node_group
+    else:
+        # Rebuild in place, so all the nodes using the group stay valid
+        clear_node_group(node_group)
+
+    BUILDERS[name](NodeGroupBuilder(node_group))
+    node_group[VERSION_CUSTOM_PROP] = BUILDERS_VERSION
+    return node_group
+
+
+def ensure_node_groups_built() -> None:
+    for name in BUILDERS:
+        ensure_node_group(name)